@@ -36,201 +36,214 @@ Classes:
     - FlightSearchResult: Agent-friendly result with error handling
 """
 
+
+import importlib
+from typing import Any, Dict, Tuple
+
+# Public names are resolved lazily (PEP 562) so that `import fast_flights`
+# does not pull in protobuf, pydantic, sqlite3 or the HTTP stack until a
+# name that needs them is actually accessed. See __init__.pyi for types.
+_LAZY_MAP: Dict[str, Tuple[str, str]] = {
+    # Core API
+    "Airport": ("flights_impl", "Airport"),
+    "TFSData": ("flights_impl", "TFSData"),
+    "create_filter": ("filter", "create_filter"),
+    "FlightData": ("flights_impl", "FlightData"),
+    "Passengers": ("flights_impl", "Passengers"),
+    "get_flights_from_filter": ("core", "get_flights_from_filter"),
+    "get_flights": ("core", "get_flights"),
+    "Result": ("schema", "Result"),
+    "Flight": ("schema", "Flight"),
+    "search_airport": ("search", "search_airport"),
+    # Type definitions
+    "SeatClass": ("types", "SeatClass"),
+    "TripType": ("types", "TripType"),
+    "FetchMode": ("types", "FetchMode"),
+    "DataSource": ("types", "DataSource"),
+    "PriceLevel": ("types", "PriceLevel"),
+    "DummyResponse": ("types", "DummyResponse"),
+    "SEAT_CLASSES": ("types", "SEAT_CLASSES"),
+    "TRIP_TYPES": ("types", "TRIP_TYPES"),
+    "FETCH_MODES": ("types", "FETCH_MODES"),
+    # Utilities
+    "extract_price": ("utils", "extract_price"),
+    "format_duration": ("utils", "format_duration"),
+    "format_time": ("utils", "format_time"),
+    "validate_airport_code": ("utils", "validate_airport_code"),
+    "validate_date": ("utils", "validate_date"),
+    "build_google_flights_url": ("utils", "build_google_flights_url"),
+    # Agent-friendly API (requires pydantic)
+    "search_flights": ("agent_api", "search_flights"),
+    "search_airports": ("agent_api", "search_airports"),
+    "compare_flight_dates": ("agent_api", "compare_flight_dates"),
+    "FlightSearchRequest": ("schema_v2", "FlightSearchRequest"),
+    "FlightSearchResult": ("schema_v2", "FlightSearchResult"),
+    "FlightSchema": ("schema_v2", "FlightSchema"),
+    "ErrorCode": ("errors", "ErrorCode"),
+    "FlightSearchError": ("errors", "FlightSearchError"),
+    "FlightAPIException": ("errors", "FlightAPIException"),
+    "PYDANTIC_AVAILABLE": ("schema_v2", "PYDANTIC_AVAILABLE"),
+    # Configuration and reliability
+    "FlightConfig": ("config", "FlightConfig"),
+    "get_config": ("config", "get_config"),
+    "configure": ("config", "configure"),
+    "reset_config": ("config", "reset_config"),
+    "retry_with_backoff": ("retry", "retry_with_backoff"),
+    "RetryContext": ("retry", "RetryContext"),
+    "is_retryable_error": ("retry", "is_retryable_error"),
+    "RateLimiter": ("rate_limit", "RateLimiter"),
+    "get_rate_limiter": ("rate_limit", "get_rate_limiter"),
+    "rate_limited": ("rate_limit", "rate_limited"),
+    # Async API (requires pydantic)
+    "search_flights_async": ("async_api", "search_flights_async"),
+    "get_flights_async": ("async_api", "get_flights_async"),
+    "search_airports_async": ("async_api", "search_airports_async"),
+    "compare_flight_dates_async": ("async_api", "compare_flight_dates_async"),
+    "search_multiple_routes": ("async_api", "search_multiple_routes"),
+    "search_date_range": ("async_api", "search_date_range"),
+    "run_in_executor": ("async_api", "run_in_executor"),
+    "get_executor": ("async_api", "get_executor"),
+    "shutdown_executor": ("async_api", "shutdown_executor"),
+    # Price Tracking API (requires pydantic)
+    "PriceRecord": ("price_storage", "PriceRecord"),
+    "PriceAlert": ("price_storage", "PriceAlert"),
+    "TrackedRoute": ("price_storage", "TrackedRoute"),
+    "PriceStorageBackend": ("price_storage", "PriceStorageBackend"),
+    "SQLitePriceStorage": ("price_storage", "SQLitePriceStorage"),
+    "get_price_storage": ("price_storage", "get_price_storage"),
+    "reset_price_storage": ("price_storage", "reset_price_storage"),
+    "PriceTracker": ("price_tracker", "PriceTracker"),
+    "PriceChange": ("price_tracker", "PriceChange"),
+    "WebhookAlertHandler": ("price_tracker", "WebhookAlertHandler"),
+    "EmailAlertHandler": ("price_tracker", "EmailAlertHandler"),
+    "get_price_tracker": ("price_tracker", "get_price_tracker"),
+    "reset_price_tracker": ("price_tracker", "reset_price_tracker"),
+    # Flexible Date Search API (requires agent API)
+    "DatePrice": ("flexible_dates", "DatePrice"),
+    "FlexibleSearchResult": ("flexible_dates", "FlexibleSearchResult"),
+    "CalendarHeatmap": ("flexible_dates", "CalendarHeatmap"),
+    "search_flexible_dates": ("flexible_dates", "search_flexible_dates"),
+    "search_weekend_flights": ("flexible_dates", "search_weekend_flights"),
+    "search_weekday_flights": ("flexible_dates", "search_weekday_flights"),
+    "get_calendar_heatmap": ("flexible_dates", "get_calendar_heatmap"),
+    "suggest_best_dates": ("flexible_dates", "suggest_best_dates"),
+    "generate_date_range": ("flexible_dates", "generate_date_range"),
+    "generate_weekend_dates": ("flexible_dates", "generate_weekend_dates"),
+    "generate_weekday_dates": ("flexible_dates", "generate_weekday_dates"),
+    "generate_month_dates": ("flexible_dates", "generate_month_dates"),
+    # Airline Filtering API
+    "Alliance": ("airline_filter", "Alliance"),
+    "AircraftCategory": ("airline_filter", "AircraftCategory"),
+    "AirlineInfo": ("airline_filter", "AirlineInfo"),
+    "AirlineFilterConfig": ("airline_filter", "AirlineFilterConfig"),
+    "FilteredFlightResult": ("airline_filter", "FilteredFlightResult"),
+    "get_airline_info": ("airline_filter", "get_airline_info"),
+    "get_airline_alliance": ("airline_filter", "get_airline_alliance"),
+    "is_in_alliances": ("airline_filter", "is_in_alliances"),
+    "get_airlines_by_alliance": ("airline_filter", "get_airlines_by_alliance"),
+    "search_airlines": ("airline_filter", "search_airlines"),
+    "get_aircraft_category": ("airline_filter", "get_aircraft_category"),
+    "is_wide_body": ("airline_filter", "is_wide_body"),
+    "filter_flights": ("airline_filter", "filter_flights"),
+    "rank_flights_by_preference": ("airline_filter", "rank_flights_by_preference"),
+    "apply_airline_filters": ("airline_filter", "apply_airline_filters"),
+    "get_low_cost_carriers": ("airline_filter", "get_low_cost_carriers"),
+    "get_airlines_with_program": ("airline_filter", "get_airlines_with_program"),
+    "AIRLINES_DATABASE": ("airline_filter", "AIRLINES_DATABASE"),
+    "STAR_ALLIANCE_MEMBERS": ("airline_filter", "STAR_ALLIANCE_MEMBERS"),
+    "ONEWORLD_MEMBERS": ("airline_filter", "ONEWORLD_MEMBERS"),
+    "SKYTEAM_MEMBERS": ("airline_filter", "SKYTEAM_MEMBERS"),
+    # HTTP API (requires fastapi)
+    "http_app": ("http_api", "app"),
+    "run_http_api": ("http_api", "run"),
+}
+
+# Submodules with optional dependencies. If one of these fails to import,
+# its names resolve to None (or the value in _LAZY_DEFAULTS) instead of raising.
+_OPTIONAL_MODULES = frozenset({
+    "agent_api",
+    "schema_v2",
+    "errors",
+    "async_api",
+    "price_storage",
+    "price_tracker",
+    "flexible_dates",
+    "airline_filter",
+    "http_api",
+})
+
+_LAZY_DEFAULTS: Dict[str, Any] = {
+    "PYDANTIC_AVAILABLE": False,
+}
+
+# Private availability flags, resolved by trying to import the submodule(s).
+_AVAILABILITY_FLAGS: Dict[str, Tuple[str, ...]] = {
+    "_AGENT_API_AVAILABLE": ("agent_api", "schema_v2", "errors"),
+    "_ASYNC_API_AVAILABLE": ("async_api",),
+    "_PRICE_TRACKING_AVAILABLE": ("price_storage", "price_tracker"),
+    "_FLEX_DATES_AVAILABLE": ("flexible_dates",),
+    "_AIRLINE_FILTER_AVAILABLE": ("airline_filter",),
+    "_HTTP_API_AVAILABLE": ("http_api",),
+}
+
+
 # Lazy import Cookies to avoid heavy protobuf dependencies during import-time in tests
 def get_cookies_class():
     from .cookies_impl import Cookies
     return Cookies
 
-from .core import get_flights_from_filter, get_flights
-from .filter import create_filter
-from .flights_impl import Airport, FlightData, Passengers, TFSData
-from .schema import Flight, Result
-from .search import search_airport
 
-# Type definitions and utilities (always available)
-from .types import (
-    SeatClass, TripType, FetchMode, DataSource, PriceLevel,
-    DummyResponse, SEAT_CLASSES, TRIP_TYPES, FETCH_MODES,
-)
-from .utils import (
-    extract_price, format_duration, format_time,
-    validate_airport_code, validate_date, build_google_flights_url,
-)
+class _CookiesProxy:
+    def __getattr__(self, name):
+        _Cookies = get_cookies_class()
+        return getattr(_Cookies, name)
 
-# Agent API imports (optional - requires pydantic)
-try:
-    from .agent_api import search_flights, search_airports, compare_flight_dates
-    from .schema_v2 import FlightSearchRequest, FlightSearchResult, FlightSchema, PYDANTIC_AVAILABLE
-    from .errors import ErrorCode, FlightSearchError
-    _AGENT_API_AVAILABLE = True
-except ImportError:
-    _AGENT_API_AVAILABLE = False
-    # Create placeholders for when pydantic is not installed
-    search_flights = None  # type: ignore
-    search_airports = None  # type: ignore
-    compare_flight_dates = None  # type: ignore
-    FlightSearchRequest = None  # type: ignore
-    FlightSearchResult = None  # type: ignore
-    FlightSchema = None  # type: ignore
-    ErrorCode = None  # type: ignore
-    FlightSearchError = None  # type: ignore
-    PYDANTIC_AVAILABLE = False
 
-# Configuration and reliability (always available)
-from .config import FlightConfig, get_config, configure, reset_config
-from .retry import retry_with_backoff, RetryContext, is_retryable_error
-from .rate_limit import RateLimiter, get_rate_limiter, rate_limited
+def _resolve_cookies():
+    # Backwards-compatible name: if import fails, expose a simple proxy
+    # that will import when used
+    try:
+        return get_cookies_class()
+    except Exception:
+        return _CookiesProxy()
 
-# Async API (optional - requires pydantic)
-try:
-    from .async_api import (
-        search_flights_async,
-        search_airports_async,
-        compare_flight_dates_async,
-        search_multiple_routes,
-        search_date_range,
-        run_in_executor,
-        get_executor,
-        shutdown_executor,
-    )
-    _ASYNC_API_AVAILABLE = True
-except ImportError:
-    _ASYNC_API_AVAILABLE = False
-    search_flights_async = None  # type: ignore
-    search_airports_async = None  # type: ignore
-    compare_flight_dates_async = None  # type: ignore
-    search_multiple_routes = None  # type: ignore
-    search_date_range = None  # type: ignore
-    run_in_executor = None  # type: ignore
-    get_executor = None  # type: ignore
-    shutdown_executor = None  # type: ignore
 
-# Price Tracking API (optional - requires pydantic)
-try:
-    from .price_storage import (
-        PriceRecord,
-        PriceAlert,
-        TrackedRoute,
-        PriceStorageBackend,
-        SQLitePriceStorage,
-        get_price_storage,
-        reset_price_storage,
-    )
-    from .price_tracker import (
-        PriceTracker,
-        PriceChange,
-        WebhookAlertHandler,
-        EmailAlertHandler,
-        get_price_tracker,
-        reset_price_tracker,
-    )
-    _PRICE_TRACKING_AVAILABLE = True
-except ImportError:
-    _PRICE_TRACKING_AVAILABLE = False
-    PriceRecord = None  # type: ignore
-    PriceAlert = None  # type: ignore
-    TrackedRoute = None  # type: ignore
-    PriceStorageBackend = None  # type: ignore
-    SQLitePriceStorage = None  # type: ignore
-    get_price_storage = None  # type: ignore
-    reset_price_storage = None  # type: ignore
-    PriceTracker = None  # type: ignore
-    PriceChange = None  # type: ignore
-    WebhookAlertHandler = None  # type: ignore
-    EmailAlertHandler = None  # type: ignore
-    get_price_tracker = None  # type: ignore
-    reset_price_tracker = None  # type: ignore
+def _is_importable(*modules: str) -> bool:
+    try:
+        for module in modules:
+            importlib.import_module(f".{module}", __name__)
+    except ImportError:
+        return False
+    return True
 
-# Flexible Date Search API (optional - requires agent API)
-try:
-    from .flexible_dates import (
-        DatePrice,
-        FlexibleSearchResult,
-        CalendarHeatmap,
-        search_flexible_dates,
-        search_weekend_flights,
-        search_weekday_flights,
-        get_calendar_heatmap,
-        suggest_best_dates,
-        generate_date_range,
-        generate_weekend_dates,
-        generate_weekday_dates,
-        generate_month_dates,
-    )
-    _FLEX_DATES_AVAILABLE = True
-except ImportError:
-    _FLEX_DATES_AVAILABLE = False
-    DatePrice = None  # type: ignore
-    FlexibleSearchResult = None  # type: ignore
-    CalendarHeatmap = None  # type: ignore
-    search_flexible_dates = None  # type: ignore
-    search_weekend_flights = None  # type: ignore
-    search_weekday_flights = None  # type: ignore
-    get_calendar_heatmap = None  # type: ignore
-    suggest_best_dates = None  # type: ignore
-    generate_date_range = None  # type: ignore
-    generate_weekend_dates = None  # type: ignore
-    generate_weekday_dates = None  # type: ignore
-    generate_month_dates = None  # type: ignore
 
-# Airline Filtering API (optional)
-try:
-    from .airline_filter import (
-        Alliance,
-        AircraftCategory,
-        AirlineInfo,
-        AirlineFilterConfig,
-        FilteredFlightResult,
-        get_airline_info,
-        get_airline_alliance,
-        get_airlines_by_alliance,
-        search_airlines,
-        get_aircraft_category,
-        is_wide_body,
-        filter_flights,
-        rank_flights_by_preference,
-        apply_airline_filters,
-        get_low_cost_carriers,
-        get_airlines_with_program,
-        AIRLINES_DATABASE,
-        STAR_ALLIANCE_MEMBERS,
-        ONEWORLD_MEMBERS,
-        SKYTEAM_MEMBERS,
-    )
-    _AIRLINE_FILTER_AVAILABLE = True
-except ImportError:
-    _AIRLINE_FILTER_AVAILABLE = False
-    Alliance = None  # type: ignore
-    AircraftCategory = None  # type: ignore
-    AirlineInfo = None  # type: ignore
-    AirlineFilterConfig = None  # type: ignore
-    FilteredFlightResult = None  # type: ignore
-    get_airline_info = None  # type: ignore
-    get_airline_alliance = None  # type: ignore
-    get_airlines_by_alliance = None  # type: ignore
-    search_airlines = None  # type: ignore
-    get_aircraft_category = None  # type: ignore
-    is_wide_body = None  # type: ignore
-    filter_flights = None  # type: ignore
-    rank_flights_by_preference = None  # type: ignore
-    apply_airline_filters = None  # type: ignore
-    get_low_cost_carriers = None  # type: ignore
-    get_airlines_with_program = None  # type: ignore
-    AIRLINES_DATABASE = None  # type: ignore
-    STAR_ALLIANCE_MEMBERS = None  # type: ignore
-    ONEWORLD_MEMBERS = None  # type: ignore
-    SKYTEAM_MEMBERS = None  # type: ignore
+def __getattr__(name: str) -> Any:
+    if name == "Cookies":
+        value = _resolve_cookies()
+    elif name in _AVAILABILITY_FLAGS:
+        value = _is_importable(*_AVAILABILITY_FLAGS[name])
+    else:
+        try:
+            module, attr = _LAZY_MAP[name]
+        except KeyError:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+        try:
+            value = getattr(importlib.import_module(f".{module}", __name__), attr)
+        except ImportError:
+            if module not in _OPTIONAL_MODULES:
+                raise
+            value = _LAZY_DEFAULTS.get(name)
 
-# HTTP API (optional - requires fastapi)
-try:
-    from .http_api import app as http_app, run as run_http_api
-    _HTTP_API_AVAILABLE = True
-except ImportError:
-    _HTTP_API_AVAILABLE = False
-    http_app = None  # type: ignore
-    run_http_api = None  # type: ignore
+    # Cache so later lookups bypass __getattr__ entirely
+    globals()[name] = value
+    return value
 
-__all__ = [
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+__all__ = (
     # Core API
     "Airport",
     "TFSData",
@@ -269,6 +282,7 @@ __all__ = [
     "FlightSchema",
     "ErrorCode",
     "FlightSearchError",
+    "FlightAPIException",
     "PYDANTIC_AVAILABLE",
     # Configuration and reliability
     "FlightConfig",
@@ -283,6 +297,7 @@ __all__ = [
     "rate_limited",
     # Async API (requires pydantic)
     "search_flights_async",
+    "get_flights_async",
     "search_airports_async",
     "compare_flight_dates_async",
     "search_multiple_routes",
@@ -325,6 +340,7 @@ __all__ = [
     "FilteredFlightResult",
     "get_airline_info",
     "get_airline_alliance",
+    "is_in_alliances",
     "get_airlines_by_alliance",
     "search_airlines",
     "get_aircraft_category",
@@ -341,16 +357,4 @@ __all__ = [
     # HTTP API (requires fastapi)
     "http_app",
     "run_http_api",
-]
-
-# Backwards-compatible name: try to resolve Cookies lazily if accessed
-try:
-    Cookies = get_cookies_class()
-except Exception:
-    # If import fails, expose a simple proxy that will import when used
-    class _CookiesProxy:
-        def __getattr__(self, name):
-            _Cookies = get_cookies_class()
-            return getattr(_Cookies, name)
-
-    Cookies = _CookiesProxy()
+)
@@ -0,0 +1,163 @@
+"""Type stub for fast_flights; names are resolved lazily at runtime."""
+
+# Core API
+from .flights_impl import (
+    Airport as Airport,
+    TFSData as TFSData,
+    FlightData as FlightData,
+    Passengers as Passengers,
+)
+from .filter import create_filter as create_filter
+from .core import (
+    get_flights_from_filter as get_flights_from_filter,
+    get_flights as get_flights,
+)
+from .schema import (
+    Result as Result,
+    Flight as Flight,
+)
+from .search import search_airport as search_airport
+
+# Type definitions
+from .types import (
+    SeatClass as SeatClass,
+    TripType as TripType,
+    FetchMode as FetchMode,
+    DataSource as DataSource,
+    PriceLevel as PriceLevel,
+    DummyResponse as DummyResponse,
+    SEAT_CLASSES as SEAT_CLASSES,
+    TRIP_TYPES as TRIP_TYPES,
+    FETCH_MODES as FETCH_MODES,
+)
+
+# Utilities
+from .utils import (
+    extract_price as extract_price,
+    format_duration as format_duration,
+    format_time as format_time,
+    validate_airport_code as validate_airport_code,
+    validate_date as validate_date,
+    build_google_flights_url as build_google_flights_url,
+)
+
+# Agent-friendly API (requires pydantic)
+from .agent_api import (
+    search_flights as search_flights,
+    search_airports as search_airports,
+    compare_flight_dates as compare_flight_dates,
+)
+from .schema_v2 import (
+    FlightSearchRequest as FlightSearchRequest,
+    FlightSearchResult as FlightSearchResult,
+    FlightSchema as FlightSchema,
+    PYDANTIC_AVAILABLE as PYDANTIC_AVAILABLE,
+)
+from .errors import (
+    ErrorCode as ErrorCode,
+    FlightSearchError as FlightSearchError,
+    FlightAPIException as FlightAPIException,
+)
+
+# Configuration and reliability
+from .config import (
+    FlightConfig as FlightConfig,
+    get_config as get_config,
+    configure as configure,
+    reset_config as reset_config,
+)
+from .retry import (
+    retry_with_backoff as retry_with_backoff,
+    RetryContext as RetryContext,
+    is_retryable_error as is_retryable_error,
+)
+from .rate_limit import (
+    RateLimiter as RateLimiter,
+    get_rate_limiter as get_rate_limiter,
+    rate_limited as rate_limited,
+)
+
+# Async API (requires pydantic)
+from .async_api import (
+    search_flights_async as search_flights_async,
+    get_flights_async as get_flights_async,
+    search_airports_async as search_airports_async,
+    compare_flight_dates_async as compare_flight_dates_async,
+    search_multiple_routes as search_multiple_routes,
+    search_date_range as search_date_range,
+    run_in_executor as run_in_executor,
+    get_executor as get_executor,
+    shutdown_executor as shutdown_executor,
+)
+
+# Price Tracking API (requires pydantic)
+from .price_storage import (
+    PriceRecord as PriceRecord,
+    PriceAlert as PriceAlert,
+    TrackedRoute as TrackedRoute,
+    PriceStorageBackend as PriceStorageBackend,
+    SQLitePriceStorage as SQLitePriceStorage,
+    get_price_storage as get_price_storage,
+    reset_price_storage as reset_price_storage,
+)
+from .price_tracker import (
+    PriceTracker as PriceTracker,
+    PriceChange as PriceChange,
+    WebhookAlertHandler as WebhookAlertHandler,
+    EmailAlertHandler as EmailAlertHandler,
+    get_price_tracker as get_price_tracker,
+    reset_price_tracker as reset_price_tracker,
+)
+
+# Flexible Date Search API (requires agent API)
+from .flexible_dates import (
+    DatePrice as DatePrice,
+    FlexibleSearchResult as FlexibleSearchResult,
+    CalendarHeatmap as CalendarHeatmap,
+    search_flexible_dates as search_flexible_dates,
+    search_weekend_flights as search_weekend_flights,
+    search_weekday_flights as search_weekday_flights,
+    get_calendar_heatmap as get_calendar_heatmap,
+    suggest_best_dates as suggest_best_dates,
+    generate_date_range as generate_date_range,
+    generate_weekend_dates as generate_weekend_dates,
+    generate_weekday_dates as generate_weekday_dates,
+    generate_month_dates as generate_month_dates,
+)
+
+# Airline Filtering API
+from .airline_filter import (
+    Alliance as Alliance,
+    AircraftCategory as AircraftCategory,
+    AirlineInfo as AirlineInfo,
+    AirlineFilterConfig as AirlineFilterConfig,
+    FilteredFlightResult as FilteredFlightResult,
+    get_airline_info as get_airline_info,
+    get_airline_alliance as get_airline_alliance,
+    is_in_alliances as is_in_alliances,
+    get_airlines_by_alliance as get_airlines_by_alliance,
+    search_airlines as search_airlines,
+    get_aircraft_category as get_aircraft_category,
+    is_wide_body as is_wide_body,
+    filter_flights as filter_flights,
+    rank_flights_by_preference as rank_flights_by_preference,
+    apply_airline_filters as apply_airline_filters,
+    get_low_cost_carriers as get_low_cost_carriers,
+    get_airlines_with_program as get_airlines_with_program,
+    AIRLINES_DATABASE as AIRLINES_DATABASE,
+    STAR_ALLIANCE_MEMBERS as STAR_ALLIANCE_MEMBERS,
+    ONEWORLD_MEMBERS as ONEWORLD_MEMBERS,
+    SKYTEAM_MEMBERS as SKYTEAM_MEMBERS,
+)
+
+# HTTP API (requires fastapi)
+from .http_api import (
+    app as http_app,
+    run as run_http_api,
+)
+
+from .cookies_impl import Cookies as Cookies
+
+def get_cookies_class() -> type[Cookies]: ...
+
+__all__: tuple[str, ...]
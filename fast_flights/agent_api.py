@@ -15,22 +15,98 @@ Usage:
     >>> print(result.to_agent_response())
 """
 
-from typing import Union, Optional, Literal, List
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import TYPE_CHECKING, Any, Dict, Union, Optional, Literal, List, Sequence, Tuple
 import logging
+import time
 
-from .schema_v2 import (
-    FlightSearchRequest,
-    FlightSearchResult,
-    FlightSchema,
-    PYDANTIC_AVAILABLE,
-)
-from .core import get_flights
-from .flights_impl import FlightData, Passengers
-from .errors import FlightSearchError, ErrorCode
-from .utils import extract_price, format_duration, format_time
+from .utils import build_google_flights_url, extract_price, format_duration, format_time
+
+if TYPE_CHECKING:
+    from .schema_v2 import FlightSearchRequest, FlightSearchResult, FlightSchema
+    from .flights_impl import FlightData, Passengers
 
 logger = logging.getLogger(__name__)
 
+# The schema, protobuf and HTTP modules are imported on first use so that
+# `import fast_flights.agent_api` stays cheap (e.g. for search_airports).
+_get_flights = None
+_create_filter = None
+
+
+def _load_get_flights():
+    """Resolve core.get_flights once and cache it for later searches."""
+    global _get_flights
+    if _get_flights is None:
+        from .core import get_flights
+        _get_flights = get_flights
+    return _get_flights
+
+
+def _load_create_filter():
+    """Resolve filter.create_filter once and cache it for later URL builds."""
+    global _create_filter
+    if _create_filter is None:
+        from .filter import create_filter
+        _create_filter = create_filter
+    return _create_filter
+
+
+# Successful search results keyed by normalized request. Google Flights
+# results for the same query are stable for minutes, so repeated identical
+# searches are served from memory instead of re-scraping.
+_SEARCH_CACHE: Dict[tuple, Tuple[float, "FlightSearchResult"]] = {}
+_SEARCH_TTL = 600.0
+_SEARCH_CACHE_MAX_SIZE = 256
+
+
+# Google Flights URLs keyed by the inputs to create_filter. The URL is a
+# pure function of the request, so the protobuf build and base64 encode
+# only need to happen once per distinct search.
+_URL_CACHE: Dict[tuple, str] = {}
+_URL_CACHE_MAX_SIZE = 1024
+
+
+def _evict_oldest(cache: dict) -> None:
+    """Drop the oldest entry of an insertion-ordered cache, if any.
+
+    compare_flight_dates runs searches from a thread pool, so another thread
+    may evict the same key or insert while the keys are being iterated.
+    Losing that race just means this eviction is skipped.
+    """
+    try:
+        cache.pop(next(iter(cache), None), None)
+    except RuntimeError:
+        pass
+
+
+def clear_search_cache() -> None:
+    """Drop all cached search_flights results and search URLs."""
+    _SEARCH_CACHE.clear()
+    _URL_CACHE.clear()
+
+
+# Display names for Airport enum members. The enum is fixed-size, so the
+# cache is bounded and the title-casing is paid once per airport.
+_AIRPORT_NAME_CACHE: Dict[Any, str] = {}
+
+
+def _airport_display_name(airport) -> str:
+    """Return a human-readable name for an Airport enum member."""
+    name = _AIRPORT_NAME_CACHE.get(airport)
+    if name is None:
+        name = _AIRPORT_NAME_CACHE[airport] = airport.name.replace("_", " ").title()
+    return name
+
+
+def __getattr__(name: str) -> Any:
+    # Lazy re-exports of the schema models listed in __all__
+    if name in ("FlightSearchRequest", "FlightSearchResult", "FlightSchema"):
+        from . import schema_v2
+        return getattr(schema_v2, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # ============================================================================
 # Helper Functions (extracted for testability and clarity)
@@ -49,14 +125,20 @@ def _validate_request(request: Union["FlightSearchRequest", dict]) -> "FlightSea
     Raises:
         ValueError: If validation fails
     """
+    from .schema_v2 import FlightSearchRequest
+
     if isinstance(request, dict):
         request = FlightSearchRequest(**request)
+    elif request._validated:
+        return request
     request.validate_passengers()
     return request
 
 
-def _build_flight_data(request: "FlightSearchRequest") -> List[FlightData]:
+def _build_flight_data(request: "FlightSearchRequest") -> List["FlightData"]:
     """Build FlightData list from request."""
+    from .flights_impl import FlightData
+
     flight_data = [
         FlightData(
             date=request.departure_date,
@@ -77,8 +159,10 @@ def _build_flight_data(request: "FlightSearchRequest") -> List[FlightData]:
     return flight_data
 
 
-def _build_passengers(request: "FlightSearchRequest") -> Passengers:
+def _build_passengers(request: "FlightSearchRequest") -> "Passengers":
     """Build Passengers object from request."""
+    from .flights_impl import Passengers
+
     return Passengers(
         adults=request.adults,
         children=request.children,
@@ -88,15 +172,18 @@ def _build_passengers(request: "FlightSearchRequest") -> Passengers:
 
 
 def _generate_search_url(
-    flight_data: List[FlightData],
+    flight_data: List["FlightData"],
     request: "FlightSearchRequest",
-    passengers: Passengers
+    passengers: "Passengers"
 ) -> Optional[str]:
     """Generate Google Flights search URL."""
+    key = _url_cache_key(flight_data, request)
+    url = _URL_CACHE.get(key)
+    if url is not None:
+        return url
+
     try:
-        from .filter import create_filter
-        from .utils import build_google_flights_url
-        
+        create_filter = _load_create_filter()
         tfs = create_filter(
             flight_data=flight_data,
             trip=request.trip_type,
@@ -105,10 +192,77 @@ def _generate_search_url(
             max_stops=request.max_stops
         )
         b64 = tfs.as_b64().decode('utf-8')
-        return build_google_flights_url(b64)
+        url = build_google_flights_url(b64)
     except Exception:
         return None
 
+    if len(_URL_CACHE) >= _URL_CACHE_MAX_SIZE:
+        _evict_oldest(_URL_CACHE)
+    _URL_CACHE[key] = url
+    return url
+
+
+def _url_cache_key(flight_data: List["FlightData"], request: "FlightSearchRequest") -> tuple:
+    """Build the _URL_CACHE key from everything that feeds create_filter."""
+    return (
+        tuple(
+            (fd.date, fd.from_airport, fd.to_airport, tuple(fd.airlines or ()))
+            for fd in flight_data
+        ),
+        request.trip_type,
+        request.adults,
+        request.children,
+        request.infants_in_seat,
+        request.infants_on_lap,
+        request.seat_class,
+        request.max_stops,
+    )
+
+
+def _search_cache_key(request: "FlightSearchRequest", fetch_mode: str) -> tuple:
+    """Build the _SEARCH_CACHE key for a validated request."""
+    return (
+        request.origin.upper(),
+        request.destination.upper(),
+        request.departure_date,
+        request.return_date,
+        request.adults,
+        request.children,
+        request.infants_in_seat,
+        request.infants_on_lap,
+        request.trip_type,
+        request.seat_class,
+        request.max_stops,
+        fetch_mode,
+    )
+
+
+def _get_cached_search(key: tuple) -> Optional["FlightSearchResult"]:
+    """Return the cached result for key, or None if missing or expired."""
+    entry = _SEARCH_CACHE.get(key)
+    if entry is None:
+        return None
+    stored_at, result = entry
+    if time.monotonic() - stored_at >= _SEARCH_TTL:
+        _SEARCH_CACHE.pop(key, None)
+        return None
+    return result
+
+
+def _store_cached_search(key: tuple, result: "FlightSearchResult") -> None:
+    """Cache a successful result, evicting the oldest entry when full."""
+    if len(_SEARCH_CACHE) >= _SEARCH_CACHE_MAX_SIZE:
+        _evict_oldest(_SEARCH_CACHE)
+    _SEARCH_CACHE[key] = (time.monotonic(), result)
+
+
+def _copy_cached_search(result: "FlightSearchResult", search_url: Optional[str]) -> "FlightSearchResult":
+    """Copy a cached result for a caller, with its own flights."""
+    # model_copy is shallow; copying the list and each flight keeps sorts,
+    # filters or edits by one caller out of the entry later hits are served from
+    flights = [f.model_copy() for f in result.flights]
+    return result.model_copy(update={"search_url": search_url, "flights": flights})
+
 
 def _convert_result_flights(result) -> "tuple[List[FlightSchema], str]":
     """
@@ -117,47 +271,70 @@ def _convert_result_flights(result) -> "tuple[List[FlightSchema], str]":
     Returns:
         Tuple of (flights list, current_price)
     """
+    from .schema import Flight
+    from .schema_v2 import FlightSchema
+
     if hasattr(result, 'flights'):
         # Standard Result object
-        flights = [
-            FlightSchema(
-                is_best=f.is_best,
-                name=f.name,
-                departure=f.departure,
-                arrival=f.arrival,
-                arrival_time_ahead=getattr(f, 'arrival_time_ahead', ''),
-                duration=f.duration,
-                stops=f.stops if isinstance(f.stops, int) else 0,
-                delay=getattr(f, 'delay', None),
-                price=f.price
-            )
-            for f in result.flights
-        ]
+        result_flights = result.flights
+        if result_flights and all(type(f) is Flight for f in result_flights):
+            # Known schema: every field is present, skip the getattr defaults
+            flights = [
+                FlightSchema(
+                    is_best=f.is_best,
+                    name=f.name,
+                    departure=f.departure,
+                    arrival=f.arrival,
+                    arrival_time_ahead=f.arrival_time_ahead,
+                    duration=f.duration,
+                    stops=f.stops if isinstance(f.stops, int) else 0,
+                    delay=f.delay,
+                    price=f.price
+                )
+                for f in result_flights
+            ]
+        else:
+            flights = [
+                FlightSchema(
+                    is_best=f.is_best,
+                    name=f.name,
+                    departure=f.departure,
+                    arrival=f.arrival,
+                    arrival_time_ahead=getattr(f, 'arrival_time_ahead', ''),
+                    duration=f.duration,
+                    stops=f.stops if isinstance(f.stops, int) else 0,
+                    delay=getattr(f, 'delay', None),
+                    price=f.price
+                )
+                for f in result_flights
+            ]
         current_price = getattr(result, 'current_price', 'unknown') or 'unknown'
         return flights, current_price
     
     elif hasattr(result, 'best') and hasattr(result, 'other'):
         # DecodedResult object (from js data source)
+        _format_time = format_time
+        _format_duration = format_duration
         flights = []
-        for i, itinerary in enumerate(result.best + result.other):
-            is_best = i < len(result.best)
-            airline_names = getattr(itinerary, 'airline_names', [])
-            name = ', '.join(airline_names) if airline_names else 'Unknown'
-            
-            dep_time = getattr(itinerary, 'departure_time', (0, 0))
-            arr_time = getattr(itinerary, 'arrival_time', (0, 0))
-            
-            flights.append(FlightSchema(
-                is_best=is_best,
-                name=name,
-                departure=format_time(*dep_time) if dep_time else "",
-                arrival=format_time(*arr_time) if arr_time else "",
-                arrival_time_ahead="",
-                duration=format_duration(itinerary.travel_time) if hasattr(itinerary, 'travel_time') else "",
-                stops=len(getattr(itinerary, 'layovers', [])),
-                delay=None,
-                price=f"${itinerary.itinerary_summary.price}" if hasattr(itinerary, 'itinerary_summary') else "N/A"
-            ))
+        for is_best, itineraries in ((True, result.best), (False, result.other)):
+            for itinerary in itineraries:
+                airline_names = getattr(itinerary, 'airline_names', [])
+                name = ', '.join(airline_names) if airline_names else 'Unknown'
+                
+                dep_time = getattr(itinerary, 'departure_time', (0, 0))
+                arr_time = getattr(itinerary, 'arrival_time', (0, 0))
+                
+                flights.append(FlightSchema(
+                    is_best=is_best,
+                    name=name,
+                    departure=_format_time(*dep_time) if dep_time else "",
+                    arrival=_format_time(*arr_time) if arr_time else "",
+                    arrival_time_ahead="",
+                    duration=_format_duration(itinerary.travel_time) if hasattr(itinerary, 'travel_time') else "",
+                    stops=len(getattr(itinerary, 'layovers', [])),
+                    delay=None,
+                    price=f"${itinerary.itinerary_summary.price}" if hasattr(itinerary, 'itinerary_summary') else "N/A"
+                ))
         return flights, "unknown"
     
     return [], "unknown"
@@ -227,6 +404,9 @@ def search_flights(
         This function never raises exceptions. All errors are captured
         in the FlightSearchResult.error field for safe agent consumption.
     """
+    from .schema_v2 import FlightSearchResult, PYDANTIC_AVAILABLE
+    from .errors import FlightSearchError
+
     if not PYDANTIC_AVAILABLE:
         return FlightSearchResult(
             success=False,
@@ -238,7 +418,7 @@ def search_flights(
     try:
         request = _validate_request(request)
     except Exception as e:
-        logger.warning(f"Invalid request parameters: {e}")
+        logger.warning("Invalid request parameters: %s", e)
         return FlightSearchResult(
             success=False,
             current_price="unknown",
@@ -248,9 +428,20 @@ def search_flights(
     # Build search components
     flight_data = _build_flight_data(request)
     passengers = _build_passengers(request)
-    search_url = _generate_search_url(flight_data, request, passengers) if include_url else None
+    cache_key = _search_cache_key(request, fetch_mode)
+    
+    def result_url() -> Optional[str]:
+        # Built only once a response is assembled; failures keep the deep
+        # link so the search can still be opened in Google Flights.
+        return _generate_search_url(flight_data, request, passengers) if include_url else None
+    
+    cached = _get_cached_search(cache_key)
+    if cached is not None:
+        search_url = (cached.search_url or result_url()) if include_url else None
+        return _copy_cached_search(cached, search_url)
     
     # Execute the search
+    get_flights = _load_get_flights()
     try:
         result = get_flights(
             flight_data=flight_data,
@@ -265,7 +456,7 @@ def search_flights(
             return FlightSearchResult(
                 success=False,
                 current_price="unknown",
-                search_url=search_url,
+                search_url=result_url(),
                 error="No flights found for the specified route and dates"
             )
         
@@ -276,48 +467,35 @@ def search_flights(
             return FlightSearchResult(
                 success=False,
                 current_price="unknown",
-                search_url=search_url,
+                search_url=result_url(),
                 error="Unexpected response format from flight search"
             )
         
-        return FlightSearchResult(
+        search_result = FlightSearchResult(
             success=True,
             current_price=current_price,
             flights=flights,
-            search_url=search_url
-        )
-        
-    except AssertionError as e:
-        # HTTP errors
-        error = FlightSearchError.from_exception(e)
-        logger.warning(f"Flight search HTTP error: {error.message}")
-        return FlightSearchResult(
-            success=False,
-            current_price="unknown",
-            search_url=search_url,
-            error=error.message
-        )
-        
-    except RuntimeError as e:
-        # Parsing errors (no flights found, etc.)
-        error = FlightSearchError.from_exception(e)
-        logger.warning(f"Flight search runtime error: {error.message}")
-        return FlightSearchResult(
-            success=False,
-            current_price="unknown",
-            search_url=search_url,
-            error=error.message
+            search_url=result_url()
         )
+        # Only successes are cached so transient failures are not replayed
+        _store_cached_search(cache_key, search_result)
+        return _copy_cached_search(search_result, search_result.search_url)
         
     except Exception as e:
-        # Unexpected errors
         error = FlightSearchError.from_exception(e)
-        logger.error(f"Unexpected flight search error: {e}", exc_info=True)
+        if isinstance(e, (AssertionError, RuntimeError)):
+            # HTTP errors (AssertionError) and parsing errors such as no
+            # flights found (RuntimeError) are expected failure modes
+            logger.warning("Flight search error: %s", error.message)
+            message = error.message
+        else:
+            logger.error("Unexpected flight search error: %s", e, exc_info=True)
+            message = f"Unexpected error: {e}"
         return FlightSearchResult(
             success=False,
             current_price="unknown",
-            search_url=search_url,
-            error=f"Unexpected error: {str(e)}"
+            search_url=result_url(),
+            error=message
         )
 
 
@@ -339,29 +517,89 @@ def search_airports(query: str, limit: int = 10) -> List[dict]:
         >>> print(airports[0])
         {'code': 'NRT', 'name': 'Tokyo Narita International Airport'}
     """
-    from .search import search_airport
+    from .search import iter_airports
     
-    airports = search_airport(query)[:limit]
+    airports = islice(iter_airports(query), max(limit, 0))
     return [
         {
             "code": airport.value,
-            "name": airport.name.replace("_", " ").title()
+            "name": _airport_display_name(airport)
         }
         for airport in airports
     ]
 
 
+def _date_comparison_entry(date: str, search_result: "FlightSearchResult") -> dict:
+    """Summarize one date's search result for compare_flight_dates."""
+    if search_result.success and search_result.flights:
+        # Find cheapest flight, parsing each price exactly once; the index
+        # breaks ties toward the earliest listing
+        flights = search_result.flights
+        cheapest_value, cheapest_index = min(
+            (extract_price(flight.price), i) for i, flight in enumerate(flights)
+        )
+        cheapest = flights[cheapest_index]
+        return {
+            "date": date,
+            "_cheapest_price_value": cheapest_value,
+            "cheapest_price": cheapest.price,
+            "price_level": search_result.current_price,
+            "options_count": len(search_result.flights),
+            "cheapest_airline": cheapest.name,
+            "cheapest_duration": cheapest.duration,
+            "cheapest_stops": cheapest.stops
+        }
+    return {
+        "date": date,
+        "error": search_result.error or "No flights found"
+    }
+
+
+def _build_date_comparison(
+    origin: str,
+    destination: str,
+    dates: List[str],
+    search_results: Sequence["FlightSearchResult"],
+) -> dict:
+    """Build the compare_flight_dates response from per-date search results."""
+    results = [
+        _date_comparison_entry(date, search_result)
+        for date, search_result in zip(dates, search_results)
+    ]
+    
+    # Generate recommendation from the prices parsed above
+    valid_results = [r for r in results if "cheapest_price" in r]
+    if valid_results:
+        cheapest_day = min(valid_results, key=lambda r: r["_cheapest_price_value"])
+        recommendation = f"Best date to fly: {cheapest_day['date']} at {cheapest_day['cheapest_price']}"
+    else:
+        recommendation = "Unable to compare - no valid results found"
+    
+    # The parsed price is internal; keep the public response shape unchanged
+    for r in valid_results:
+        del r["_cheapest_price_value"]
+    
+    return {
+        "comparison": results,
+        "recommendation": recommendation,
+        "route": f"{origin} → {destination}",
+        "dates_searched": len(dates)
+    }
+
+
 def compare_flight_dates(
     origin: str,
     destination: str,
     dates: List[str],
     adults: int = 1,
     seat_class: Literal["economy", "premium-economy", "business", "first"] = "economy",
+    max_concurrent: int = 10,
 ) -> dict:
     """
     Compare flight prices across multiple dates.
     
-    Useful for finding the cheapest days to fly.
+    Useful for finding the cheapest days to fly. Dates are searched
+    concurrently, at most max_concurrent at a time.
     
     Args:
         origin: Origin airport code
@@ -369,6 +607,7 @@ def compare_flight_dates(
         dates: List of dates to compare (YYYY-MM-DD format)
         adults: Number of adult passengers
         seat_class: Seat class
+        max_concurrent: Maximum number of searches in flight at once
         
     Returns:
         Dict with 'comparison' list and 'recommendation' string
@@ -381,56 +620,29 @@ def compare_flight_dates(
         >>> print(result["recommendation"])
         "Best date to fly: 2025-06-16 at $249"
     """
-    import re
-    
-    results = []
-    for date in dates:
-        search_result = search_flights({
+    def search_date(date: str) -> "FlightSearchResult":
+        return search_flights({
             "origin": origin,
             "destination": destination,
             "departure_date": date,
             "adults": adults,
             "seat_class": seat_class
         })
-        
-        if search_result.success and search_result.flights:
-            # Find cheapest flight using shared extract_price
-            cheapest = min(search_result.flights, key=lambda f: extract_price(f.price))
-            results.append({
-                "date": date,
-                "cheapest_price": cheapest.price,
-                "price_level": search_result.current_price,
-                "options_count": len(search_result.flights),
-                "cheapest_airline": cheapest.name,
-                "cheapest_duration": cheapest.duration,
-                "cheapest_stops": cheapest.stops
-            })
-        else:
-            results.append({
-                "date": date,
-                "error": search_result.error or "No flights found"
-            })
     
-    # Generate recommendation
-    valid_results = [r for r in results if "cheapest_price" in r]
-    if valid_results:
-        cheapest_day = min(valid_results, key=lambda r: extract_price(r["cheapest_price"]))
-        recommendation = f"Best date to fly: {cheapest_day['date']} at {cheapest_day['cheapest_price']}"
-    else:
-        recommendation = "Unable to compare - no valid results found"
+    # Searches are I/O-bound; a thread pool keeps this usable from code that
+    # is already running inside an event loop (e.g. the MCP server).
+    max_workers = max(1, min(max_concurrent, len(dates)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        search_results = list(executor.map(search_date, dates))
     
-    return {
-        "comparison": results,
-        "recommendation": recommendation,
-        "route": f"{origin} → {destination}",
-        "dates_searched": len(dates)
-    }
+    return _build_date_comparison(origin, destination, dates, search_results)
 
 
 __all__ = [
     "search_flights",
     "search_airports",
     "compare_flight_dates",
+    "clear_search_cache",
     "FlightSearchRequest",
     "FlightSearchResult",
     "FlightSchema",
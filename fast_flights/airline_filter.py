@@ -5,16 +5,14 @@ Provides airline preferences, alliance filtering, aircraft type filtering,
 and loyalty program integration for prioritizing preferred carriers.
 """
 
+import re
+import sys
+from array import array
+from collections import Counter
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Set, Union
-
-try:
-    from pydantic import BaseModel, Field
-    PYDANTIC_AVAILABLE = True
-except ImportError:
-    PYDANTIC_AVAILABLE = False
-    BaseModel = object  # type: ignore
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple, Union
 
 
 # ============================================================================
@@ -30,7 +28,7 @@ class Alliance(str, Enum):
 
 
 # Alliance member airlines (IATA codes)
-STAR_ALLIANCE_MEMBERS: Set[str] = {
+STAR_ALLIANCE_MEMBERS: FrozenSet[str] = frozenset({
     "AC",  # Air Canada
     "CA",  # Air China
     "AI",  # Air India
@@ -55,9 +53,9 @@ STAR_ALLIANCE_MEMBERS: Set[str] = {
     "TG",  # Thai Airways
     "TK",  # Turkish Airlines
     "UA",  # United Airlines
-}
+})
 
-ONEWORLD_MEMBERS: Set[str] = {
+ONEWORLD_MEMBERS: FrozenSet[str] = frozenset({
     "AA",  # American Airlines
     "BA",  # British Airways
     "CX",  # Cathay Pacific
@@ -72,9 +70,9 @@ ONEWORLD_MEMBERS: Set[str] = {
     "UL",  # SriLankan Airlines
     "FJ",  # Fiji Airways (oneworld connect)
     "AS",  # Alaska Airlines
-}
+})
 
-SKYTEAM_MEMBERS: Set[str] = {
+SKYTEAM_MEMBERS: FrozenSet[str] = frozenset({
     "SU",  # Aeroflot
     "AR",  # Aerolíneas Argentinas
     "AM",  # Aeroméxico
@@ -94,14 +92,29 @@ SKYTEAM_MEMBERS: Set[str] = {
     "VN",  # Vietnam Airlines
     "VS",  # Virgin Atlantic
     "MF",  # Xiamen Airlines
-}
+})
 
-ALLIANCE_MAP: Dict[Alliance, Set[str]] = {
+ALLIANCE_MAP: Dict[Alliance, FrozenSet[str]] = {
     Alliance.STAR_ALLIANCE: STAR_ALLIANCE_MEMBERS,
     Alliance.ONEWORLD: ONEWORLD_MEMBERS,
     Alliance.SKYTEAM: SKYTEAM_MEMBERS,
 }
 
+# Reverse index (IATA code -> alliance) for single-probe alliance lookups
+_AIRLINE_TO_ALLIANCE: Dict[str, Alliance] = {
+    code: alliance
+    for alliance, members in ALLIANCE_MAP.items()
+    for code in members
+}
+
+# Valid Alliance values, for validating user-supplied alliance names
+_ALLIANCE_VALUES: FrozenSet[str] = frozenset(a.value for a in Alliance)
+
+# Every airline in one of the three major alliances
+_ALL_MAJOR_ALLIANCE_MEMBERS: FrozenSet[str] = (
+    STAR_ALLIANCE_MEMBERS | ONEWORLD_MEMBERS | SKYTEAM_MEMBERS
+)
+
 
 # ============================================================================
 # Aircraft Types
@@ -116,7 +129,7 @@ class AircraftCategory(str, Enum):
 
 
 # Common aircraft models by category
-WIDE_BODY_AIRCRAFT: Set[str] = {
+WIDE_BODY_AIRCRAFT: FrozenSet[str] = frozenset({
     # Boeing
     "747", "B747", "747-8", "747-400",
     "767", "B767", "767-300", "767-400",
@@ -127,9 +140,9 @@ WIDE_BODY_AIRCRAFT: Set[str] = {
     "A340", "340", "A340-300", "A340-600",
     "A350", "350", "A350-900", "A350-1000",
     "A380", "380",
-}
+})
 
-NARROW_BODY_AIRCRAFT: Set[str] = {
+NARROW_BODY_AIRCRAFT: FrozenSet[str] = frozenset({
     # Boeing
     "737", "B737", "737-700", "737-800", "737-900", "737 MAX", "737MAX",
     "757", "B757", "757-200", "757-300",
@@ -137,27 +150,40 @@ NARROW_BODY_AIRCRAFT: Set[str] = {
     "A319", "319",
     "A320", "320", "A320neo",
     "A321", "321", "A321neo", "A321XLR",
-}
+})
 
-REGIONAL_AIRCRAFT: Set[str] = {
+REGIONAL_AIRCRAFT: FrozenSet[str] = frozenset({
     "CRJ", "CRJ-200", "CRJ-700", "CRJ-900",
     "ERJ", "E170", "E175", "E190", "E195", "E195-E2",
     "Embraer",
-}
+})
 
-TURBOPROP_AIRCRAFT: Set[str] = {
+TURBOPROP_AIRCRAFT: FrozenSet[str] = frozenset({
     "ATR", "ATR 42", "ATR 72",
     "Dash 8", "Q400", "DHC-8",
     "Saab 340", "Saab 2000",
-}
+})
 
-AIRCRAFT_CATEGORY_MAP: Dict[AircraftCategory, Set[str]] = {
+AIRCRAFT_CATEGORY_MAP: Dict[AircraftCategory, FrozenSet[str]] = {
     AircraftCategory.WIDE_BODY: WIDE_BODY_AIRCRAFT,
     AircraftCategory.NARROW_BODY: NARROW_BODY_AIRCRAFT,
     AircraftCategory.REGIONAL: REGIONAL_AIRCRAFT,
     AircraftCategory.TURBOPROP: TURBOPROP_AIRCRAFT,
 }
 
+# Models pre-uppercased once, in AIRCRAFT_CATEGORY_MAP order, for the
+# substring scan in get_aircraft_category
+_AIRCRAFT_MODELS_UPPER: Tuple[Tuple[AircraftCategory, Tuple[str, ...]], ...] = tuple(
+    (category, tuple(model.upper() for model in models))
+    for category, models in AIRCRAFT_CATEGORY_MAP.items()
+)
+
+# Exact uppercased model -> category; earlier categories win on duplicates
+_EXACT_AIRCRAFT_LOOKUP: Dict[str, AircraftCategory] = {}
+for _category, _models in reversed(_AIRCRAFT_MODELS_UPPER):
+    _EXACT_AIRCRAFT_LOOKUP.update(dict.fromkeys(_models, _category))
+del _category, _models
+
 
 # ============================================================================
 # Airline Information Database
@@ -254,6 +280,52 @@ AIRLINES_DATABASE: Dict[str, AirlineInfo] = {
     "MS": AirlineInfo("MS", "EgyptAir", Alliance.STAR_ALLIANCE, "EG", False, "EgyptAir Plus"),
 }
 
+# Lowercased airline names in database order, for substring matching
+_AIRLINE_NAMES_LOWER: Tuple[Tuple[str, str], ...] = tuple(
+    (code, info.name.lower()) for code, info in AIRLINES_DATABASE.items()
+)
+
+# (code, name) lowercased alongside each entry, for search_airlines
+_AIRLINES_SEARCH_INDEX: Tuple[Tuple[str, str, AirlineInfo], ...] = tuple(
+    (code.lower(), info.name.lower(), info) for code, info in AIRLINES_DATABASE.items()
+)
+
+# Short names that commonly appear in Google Flights carrier strings
+_COMMON_AIRLINE_NAMES: Tuple[Tuple[str, str], ...] = (
+    ("delta", "DL"),
+    ("united", "UA"),
+    ("american", "AA"),
+    ("southwest", "WN"),
+    ("jetblue", "B6"),
+    ("alaska", "AS"),
+    ("spirit", "NK"),
+    ("frontier", "F9"),
+    ("lufthansa", "LH"),
+    ("british airways", "BA"),
+    ("air france", "AF"),
+    ("emirates", "EK"),
+    ("qatar", "QR"),
+    ("singapore", "SQ"),
+)
+
+
+def _match_airline_name(airline_name_lower: str) -> str:
+    """Substring-match a lowercased airline name against known carriers."""
+    for code, name in _AIRLINE_NAMES_LOWER:
+        if name in airline_name_lower or airline_name_lower in name:
+            return code
+    for name, code in _COMMON_AIRLINE_NAMES:
+        if name in airline_name_lower:
+            return code
+    return ""
+
+
+# Exact lowercased database name -> code, resolved with the same rules as
+# the substring scan so the fast path never disagrees with it
+_NAME_TO_CODE: Dict[str, str] = {
+    name: _match_airline_name(name) for _, name in _AIRLINE_NAMES_LOWER
+}
+
 
 # ============================================================================
 # Filter Configuration
@@ -283,6 +355,26 @@ class AirlineFilterConfig:
     preferred_airlines: List[str] = field(default_factory=list)  # Boost these in ranking
     loyalty_program: Optional[str] = None  # User's primary loyalty program
     
+    # Compiled filter predicate, cached with the field values it was built
+    # from so a mutated config is recompiled (see _make_flight_filter).
+    # Left unannotated so it stays out of fields(), asdict() and __eq__;
+    # _make_flight_filter shadows it per instance.
+    _compiled_filter = None
+    
+    def _filter_key(self) -> tuple:
+        """Snapshot of the fields that determine the filter predicate."""
+        return (
+            tuple(self.include_airlines),
+            tuple(self.exclude_airlines),
+            tuple(self.include_alliances),
+            tuple(self.exclude_alliances),
+            self.include_low_cost,
+            self.only_low_cost,
+            tuple(self.preferred_aircraft_categories),
+            tuple(self.exclude_aircraft_categories),
+            tuple(self.exclude_aircraft_models),
+        )
+    
     def to_dict(self) -> Dict[str, Any]:
         return {
             "include_airlines": self.include_airlines,
@@ -310,16 +402,23 @@ def get_airline_info(code: str) -> Optional[AirlineInfo]:
 
 def get_airline_alliance(code: str) -> Alliance:
     """Get the alliance for an airline."""
-    code = code.upper()
-    for alliance, members in ALLIANCE_MAP.items():
-        if code in members:
-            return alliance
-    return Alliance.NONE
+    return _AIRLINE_TO_ALLIANCE.get(code.upper(), Alliance.NONE)
+
+
+@lru_cache(maxsize=16)
+def _members_of(alliances: FrozenSet[Alliance]) -> FrozenSet[str]:
+    """Union of member codes for a set of alliances, cached per combination."""
+    return frozenset().union(*(ALLIANCE_MAP[a] for a in alliances if a in ALLIANCE_MAP))
+
+
+def is_in_alliances(code: str, alliances: Iterable[Alliance]) -> bool:
+    """Check whether an airline belongs to any of the given alliances."""
+    return code.upper() in _members_of(frozenset(alliances))
 
 
 def get_airlines_by_alliance(alliance: Alliance) -> List[AirlineInfo]:
     """Get all airlines in an alliance."""
-    codes = ALLIANCE_MAP.get(alliance, set())
+    codes = ALLIANCE_MAP.get(alliance, frozenset())
     return [AIRLINES_DATABASE[code] for code in codes if code in AIRLINES_DATABASE]
 
 
@@ -328,8 +427,8 @@ def search_airlines(query: str, limit: int = 10) -> List[AirlineInfo]:
     query = query.lower()
     results = []
     
-    for code, info in AIRLINES_DATABASE.items():
-        if query in code.lower() or query in info.name.lower():
+    for code, name, info in _AIRLINES_SEARCH_INDEX:
+        if query in code or query in name:
             results.append(info)
             if len(results) >= limit:
                 break
@@ -337,21 +436,221 @@ def search_airlines(query: str, limit: int = 10) -> List[AirlineInfo]:
     return results
 
 
+@lru_cache(maxsize=1024)
 def get_aircraft_category(aircraft: str) -> Optional[AircraftCategory]:
     """Determine the category of an aircraft model."""
     aircraft = aircraft.upper()
-    for category, models in AIRCRAFT_CATEGORY_MAP.items():
+    category = _EXACT_AIRCRAFT_LOOKUP.get(aircraft)
+    if category is not None:
+        return category
+    for category, models in _AIRCRAFT_MODELS_UPPER:
         for model in models:
-            if model.upper() in aircraft or aircraft in model.upper():
+            if model in aircraft or aircraft in model:
                 return category
     return None
 
 
+@lru_cache(maxsize=1024)
 def is_wide_body(aircraft: str) -> bool:
     """Check if an aircraft is wide-body."""
     return get_aircraft_category(aircraft) == AircraftCategory.WIDE_BODY
 
 
+def _flight_airline_code(flight: Dict[str, Any]) -> str:
+    """Extract the airline IATA code from a flight dictionary."""
+    return _extract_airline_code(flight.get("name") or flight.get("airline") or "")
+
+
+def _make_flight_filter(
+    config: AirlineFilterConfig,
+) -> Optional[Callable[[Dict[str, Any], str, Alliance], bool]]:
+    """
+    Return the filter predicate for a config, reusing it across calls.
+    
+    The compiled predicate is stored on the config together with a snapshot
+    of its filter fields, so repeated calls with the same config (e.g. across
+    pages of results) skip recompilation, while mutating it invalidates it.
+    """
+    key = config._filter_key()
+    cached = config._compiled_filter
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    keep = _compile_flight_filter(config)
+    config._compiled_filter = (key, keep)
+    return keep
+
+
+def _compile_flight_filter(
+    config: AirlineFilterConfig,
+) -> Optional[Callable[[Dict[str, Any], str, Alliance], bool]]:
+    """
+    Build a predicate deciding whether a flight passes the config filters.
+    
+    Only the checks that are active in the config are compiled in, so the
+    per-flight cost scales with the filters actually in use.
+    
+    Returns:
+        Predicate taking (flight, airline_code, alliance), or None when the
+        config filters nothing and every flight passes
+    """
+    # Normalize the configured lists once rather than per flight
+    include_codes = frozenset(a.upper() for a in config.include_airlines)
+    exclude_codes = frozenset(a.upper() for a in config.exclude_airlines)
+    include_alliances = frozenset(config.include_alliances)
+    exclude_alliances = frozenset(config.exclude_alliances)
+    preferred_categories = frozenset(config.preferred_aircraft_categories)
+    exclude_categories = frozenset(config.exclude_aircraft_categories)
+    exclude_models = tuple(m.upper() for m in config.exclude_aircraft_models)
+    # Longer exclusion lists are matched in one pass by a single alternation
+    exclude_models_pattern = (
+        re.compile("|".join(map(re.escape, exclude_models)))
+        if len(exclude_models) > 2 else None
+    )
+    include_low_cost = config.include_low_cost
+    only_low_cost = config.only_low_cost
+    
+    # Checks are appended roughly from most to least selective, so the
+    # combined predicate rejects most flights on its first check
+    checks: List[Callable[[Dict[str, Any], str, Alliance], bool]] = []
+    
+    # Airline and alliance inclusion
+    if len(include_codes) == 1:
+        (only_code,) = include_codes
+        checks.append(lambda flight, code, alliance: code == only_code)
+    elif include_codes:
+        checks.append(lambda flight, code, alliance: code in include_codes)
+    if include_alliances:
+        checks.append(lambda flight, code, alliance: alliance in include_alliances)
+    
+    # Airline and alliance exclusion
+    if exclude_codes:
+        checks.append(lambda flight, code, alliance: code not in exclude_codes)
+    if exclude_alliances:
+        checks.append(lambda flight, code, alliance: alliance not in exclude_alliances)
+    
+    # Aircraft preferences
+    if preferred_categories or exclude_categories or exclude_models:
+        def aircraft_ok(flight: Dict[str, Any], code: str, alliance: Alliance) -> bool:
+            aircraft = flight.get("aircraft") or flight.get("plane") or ""
+            if not aircraft:
+                return True
+            aircraft_category = get_aircraft_category(aircraft)
+            
+            if preferred_categories:
+                if aircraft_category and aircraft_category not in preferred_categories:
+                    return False
+            
+            if exclude_categories:
+                if aircraft_category and aircraft_category in exclude_categories:
+                    return False
+            
+            if exclude_models_pattern is not None:
+                if exclude_models_pattern.search(aircraft.upper()):
+                    return False
+            elif exclude_models:
+                aircraft_upper = aircraft.upper()
+                if any(model in aircraft_upper for model in exclude_models):
+                    return False
+            
+            return True
+        checks.append(aircraft_ok)
+    
+    # Low-cost preferences
+    if not include_low_cost or only_low_cost:
+        def low_cost_ok(flight: Dict[str, Any], code: str, alliance: Alliance) -> bool:
+            airline_info = AIRLINES_DATABASE.get(code) if code else None
+            if not airline_info:
+                return True
+            if not include_low_cost and airline_info.is_low_cost:
+                return False
+            if only_low_cost and not airline_info.is_low_cost:
+                return False
+            return True
+        checks.append(low_cost_ok)
+    
+    if not checks:
+        return None
+    if len(checks) == 1:
+        return checks[0]
+    
+    def keep(flight: Dict[str, Any], airline_code: str, alliance: Alliance) -> bool:
+        for check in checks:
+            if not check(flight, airline_code, alliance):
+                return False
+        return True
+    
+    return keep
+
+
+def _make_preference_scorer(
+    config: AirlineFilterConfig,
+) -> Callable[[Dict[str, Any], str], int]:
+    """Build a function scoring a flight against the config preferences."""
+    preferred_codes = frozenset(a.upper() for a in config.preferred_airlines)
+    loyalty_program = config.loyalty_program.lower() if config.loyalty_program else None
+    # Per-ranking aircraft classification, so each distinct aircraft string
+    # is classified once without touching the shared lru_cache per flight
+    wide_body: Dict[str, bool] = {}
+    
+    def score_flight(flight: Dict[str, Any], airline_code: str) -> int:
+        score = 0
+        
+        # Boost preferred airlines
+        if airline_code and airline_code in preferred_codes:
+            score += 100
+        
+        # Boost airlines matching loyalty program
+        if loyalty_program and airline_code:
+            airline_info = AIRLINES_DATABASE.get(airline_code)
+            if airline_info and airline_info.frequent_flyer_program:
+                # Same program or partner
+                if loyalty_program in airline_info.frequent_flyer_program.lower():
+                    score += 50
+                # Same alliance (can earn miles)
+                if airline_code in _ALL_MAJOR_ALLIANCE_MEMBERS:
+                    score += 25
+        
+        # Boost wide-body aircraft (comfort)
+        aircraft = flight.get("aircraft") or flight.get("plane") or ""
+        if aircraft:
+            is_wide = wide_body.get(aircraft)
+            if is_wide is None:
+                is_wide = wide_body[aircraft] = is_wide_body(aircraft)
+            if is_wide:
+                score += 10
+        
+        return score
+    
+    return score_flight
+
+
+def _iter_kept_flights(
+    flights: List[Dict[str, Any]],
+    keep: Optional[Callable[[Dict[str, Any], str, Alliance], bool]],
+) -> Iterator[Tuple[Dict[str, Any], str, Alliance]]:
+    """
+    Yield (flight, airline_code, alliance) for flights that pass keep.
+    
+    A filter decision depends only on the airline and aircraft strings, and
+    large result sets repeat the same few carriers and aircraft many times.
+    Decisions are therefore made once per distinct pair and reused.
+    """
+    decisions: Dict[Tuple[str, str], Tuple[str, Alliance, bool]] = {}
+    for flight in flights:
+        airline_name = flight.get("name") or flight.get("airline") or ""
+        aircraft = flight.get("aircraft") or flight.get("plane") or ""
+        key = (airline_name, aircraft)
+        decision = decisions.get(key)
+        if decision is None:
+            airline_code = _extract_airline_code(airline_name)
+            alliance = _AIRLINE_TO_ALLIANCE.get(airline_code, Alliance.NONE)
+            passed = keep is None or keep(flight, airline_code, alliance)
+            decision = decisions[key] = (airline_code, alliance, passed)
+        airline_code, alliance, passed = decision
+        if passed:
+            yield flight, airline_code, alliance
+
+
 def filter_flights(
     flights: List[Dict[str, Any]],
     config: AirlineFilterConfig,
@@ -366,64 +665,11 @@ def filter_flights(
     Returns:
         Filtered list of flights
     """
-    filtered = []
-    
-    for flight in flights:
-        # Get airline code from flight
-        airline_name = flight.get("name") or flight.get("airline") or ""
-        airline_code = _extract_airline_code(airline_name)
-        
-        # Get airline info
-        airline_info = get_airline_info(airline_code) if airline_code else None
-        alliance = get_airline_alliance(airline_code) if airline_code else Alliance.NONE
-        
-        # Check airline inclusion
-        if config.include_airlines:
-            if airline_code not in [a.upper() for a in config.include_airlines]:
-                continue
-        
-        # Check airline exclusion
-        if config.exclude_airlines:
-            if airline_code in [a.upper() for a in config.exclude_airlines]:
-                continue
-        
-        # Check alliance inclusion
-        if config.include_alliances:
-            if alliance not in config.include_alliances:
-                continue
-        
-        # Check alliance exclusion
-        if config.exclude_alliances:
-            if alliance in config.exclude_alliances:
-                continue
-        
-        # Check low-cost preferences
-        if airline_info:
-            if not config.include_low_cost and airline_info.is_low_cost:
-                continue
-            if config.only_low_cost and not airline_info.is_low_cost:
-                continue
-        
-        # Check aircraft preferences
-        aircraft = flight.get("aircraft") or flight.get("plane") or ""
-        if aircraft:
-            aircraft_category = get_aircraft_category(aircraft)
-            
-            if config.preferred_aircraft_categories:
-                if aircraft_category and aircraft_category not in config.preferred_aircraft_categories:
-                    continue
-            
-            if config.exclude_aircraft_categories:
-                if aircraft_category and aircraft_category in config.exclude_aircraft_categories:
-                    continue
-            
-            if config.exclude_aircraft_models:
-                if any(model.upper() in aircraft.upper() for model in config.exclude_aircraft_models):
-                    continue
-        
-        filtered.append(flight)
+    keep = _make_flight_filter(config)
+    if keep is None:
+        return list(flights)
     
-    return filtered
+    return [flight for flight, _, _ in _iter_kept_flights(flights, keep)]
 
 
 def rank_flights_by_preference(
@@ -440,79 +686,40 @@ def rank_flights_by_preference(
     Returns:
         Sorted list of flights with preference scoring
     """
-    def score_flight(flight: Dict[str, Any]) -> int:
-        score = 0
-        airline_name = flight.get("name") or flight.get("airline") or ""
-        airline_code = _extract_airline_code(airline_name)
-        
-        # Boost preferred airlines
-        if airline_code and airline_code.upper() in [a.upper() for a in config.preferred_airlines]:
-            score += 100
-        
-        # Boost airlines matching loyalty program
-        if config.loyalty_program and airline_code:
-            airline_info = get_airline_info(airline_code)
-            if airline_info and airline_info.frequent_flyer_program:
-                # Same program or partner
-                if config.loyalty_program.lower() in airline_info.frequent_flyer_program.lower():
-                    score += 50
-                # Same alliance (can earn miles)
-                alliance = get_airline_alliance(airline_code)
-                if alliance != Alliance.NONE:
-                    score += 25
-        
-        # Boost wide-body aircraft (comfort)
-        aircraft = flight.get("aircraft") or flight.get("plane") or ""
-        if aircraft and is_wide_body(aircraft):
-            score += 10
-        
-        return score
-    
-    # Sort by score (descending), then keep original order for ties
-    scored = [(score_flight(f), i, f) for i, f in enumerate(flights)]
-    scored.sort(key=lambda x: (-x[0], x[1]))
-    
-    return [f for _, _, f in scored]
+    score_flight = _make_preference_scorer(config)
+    
+    # Sort by score (descending); the sort is stable, so ties keep their
+    # original order
+    return sorted(
+        flights,
+        key=lambda f: score_flight(f, _flight_airline_code(f)),
+        reverse=True,
+    )
 
 
+@lru_cache(maxsize=1024)
 def _extract_airline_code(airline_name: str) -> str:
-    """Extract airline IATA code from airline name."""
+    """
+    Extract airline IATA code from airline name.
+    
+    The result is always an upper-case, interned IATA code (or "" when the
+    airline is unknown), so callers can probe the code sets and
+    AIRLINES_DATABASE directly without normalizing it again.
+    """
     if not airline_name:
         return ""
     
-    # Check if it's already a code
+    # Check if it's already a code. Interned so set and dict probes against
+    # the (already interned) database codes short-circuit on identity; the
+    # lru_cache above then hands this same object back on later calls.
     if len(airline_name) == 2 and airline_name.isupper():
-        return airline_name
+        return sys.intern(airline_name)
     
-    # Search by name
     airline_name_lower = airline_name.lower()
-    for code, info in AIRLINES_DATABASE.items():
-        if info.name.lower() in airline_name_lower or airline_name_lower in info.name.lower():
-            return code
-    
-    # Try common patterns
-    name_to_code = {
-        "delta": "DL",
-        "united": "UA",
-        "american": "AA",
-        "southwest": "WN",
-        "jetblue": "B6",
-        "alaska": "AS",
-        "spirit": "NK",
-        "frontier": "F9",
-        "lufthansa": "LH",
-        "british airways": "BA",
-        "air france": "AF",
-        "emirates": "EK",
-        "qatar": "QR",
-        "singapore": "SQ",
-    }
-    
-    for name, code in name_to_code.items():
-        if name in airline_name_lower:
-            return code
-    
-    return ""
+    code = _NAME_TO_CODE.get(airline_name_lower)
+    if code is not None:
+        return code
+    return _match_airline_name(airline_name_lower)
 
 
 # ============================================================================
@@ -576,8 +783,8 @@ def apply_airline_filters(
     config = AirlineFilterConfig(
         include_airlines=include_airlines or [],
         exclude_airlines=exclude_airlines or [],
-        include_alliances=[Alliance(a) for a in (alliances or []) if a in [e.value for e in Alliance]],
-        exclude_alliances=[Alliance(a) for a in (exclude_alliances or []) if a in [e.value for e in Alliance]],
+        include_alliances=[Alliance(a) for a in (alliances or []) if a in _ALLIANCE_VALUES],
+        exclude_alliances=[Alliance(a) for a in (exclude_alliances or []) if a in _ALLIANCE_VALUES],
         include_low_cost=include_low_cost,
         only_low_cost=only_low_cost,
         preferred_aircraft_categories=[AircraftCategory.WIDE_BODY] if wide_body_only else [],
@@ -605,34 +812,40 @@ def apply_airline_filters(
     if exclude_regional:
         filters_applied.append("No regional aircraft")
     
-    # Apply filters
-    filtered = filter_flights(flights, config)
+    # Filter, score and classify every flight in a single pass so the
+    # airline code is only extracted once per flight
+    keep = _make_flight_filter(config)
+    rank = bool(preferred_airlines or loyalty_program)
+    score_flight = _make_preference_scorer(config) if rank else None
+    preferred_codes = frozenset(a.upper() for a in (preferred_airlines or []))
+    
+    # Kept flights, their scores and alliance names as parallel columns
+    filtered = []
+    scores = array("i")
+    alliance_names = []
+    preferred_count = 0
+    for flight, airline_code, alliance in _iter_kept_flights(flights, keep):
+        filtered.append(flight)
+        alliance_names.append(alliance.value)
+        if score_flight:
+            scores.append(score_flight(flight, airline_code))
+        # Count preferred airlines in results
+        if airline_code and airline_code in preferred_codes:
+            preferred_count += 1
     
     # Rank by preference
-    if preferred_airlines or loyalty_program:
-        filtered = rank_flights_by_preference(filtered, config)
+    if rank:
+        # Stable argsort on the score column; ties keep their original order
+        order = sorted(range(len(scores)), key=scores.__getitem__, reverse=True)
+        filtered = [filtered[i] for i in order]
+        alliance_names = [alliance_names[i] for i in order]
         if preferred_airlines:
             filters_applied.append(f"Preferred: {', '.join(preferred_airlines)}")
         if loyalty_program:
             filters_applied.append(f"Loyalty: {loyalty_program}")
     
-    # Count preferred airlines in results
-    preferred_count = 0
-    if preferred_airlines:
-        for flight in filtered:
-            airline_name = flight.get("name") or flight.get("airline") or ""
-            airline_code = _extract_airline_code(airline_name)
-            if airline_code and airline_code.upper() in [a.upper() for a in preferred_airlines]:
-                preferred_count += 1
-    
     # Alliance breakdown
-    alliance_breakdown: Dict[str, int] = {}
-    for flight in filtered:
-        airline_name = flight.get("name") or flight.get("airline") or ""
-        airline_code = _extract_airline_code(airline_name)
-        alliance = get_airline_alliance(airline_code) if airline_code else Alliance.NONE
-        alliance_name = alliance.value
-        alliance_breakdown[alliance_name] = alliance_breakdown.get(alliance_name, 0) + 1
+    alliance_breakdown = Counter(alliance_names)
     
     return FilteredFlightResult(
         original_count=len(flights),
@@ -640,7 +853,7 @@ def apply_airline_filters(
         filters_applied=filters_applied,
         flights=filtered,
         preferred_count=preferred_count,
-        alliance_breakdown=alliance_breakdown,
+        alliance_breakdown=dict(alliance_breakdown),
     )
 
 
@@ -666,7 +879,7 @@ def get_airlines_with_program(program_name: str) -> List[AirlineInfo]:
     if results:
         alliance = results[0].alliance
         if alliance != Alliance.NONE:
-            for code in ALLIANCE_MAP.get(alliance, set()):
+            for code in ALLIANCE_MAP.get(alliance, frozenset()):
                 if code in AIRLINES_DATABASE and AIRLINES_DATABASE[code] not in results:
                     results.append(AIRLINES_DATABASE[code])
     
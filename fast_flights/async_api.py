@@ -32,6 +32,9 @@ Example:
 from __future__ import annotations
 
 import asyncio
+import re
+import sys
+import threading
 from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Callable, Dict, List, Optional, TypeVar
 from functools import partial
@@ -39,30 +42,48 @@ from functools import partial
 # Type variable for generic async wrapper
 T = TypeVar("T")
 
+# Everything that is not part of a number in a price string like "$1,234"
+_NON_PRICE_CHARS = re.compile(r"[^\d.]")
+
 # Default thread pool for running sync operations
 _executor: Optional[ThreadPoolExecutor] = None
 _max_workers: int = 10
+# Worker count the live _executor was built with; _max_workers may have
+# changed since, but only takes effect once the pool is recreated
+_executor_workers: int = 0
+_executor_lock = threading.Lock()
 
 
 def get_executor(max_workers: Optional[int] = None) -> ThreadPoolExecutor:
     """
     Get or create the thread pool executor for async operations.
     
+    The fetch backends are synchronous, so flight searches that need the
+    network run here; validation errors, cache hits and airport lookups are
+    answered on the event loop without touching the pool. The worker count
+    also bounds how many searches hit Google at once.
+    
     Args:
         max_workers: Maximum number of worker threads. Uses default if not specified.
         
     Returns:
         ThreadPoolExecutor instance.
     """
-    global _executor, _max_workers
+    global _executor, _executor_workers, _max_workers
     
     if max_workers is not None:
         _max_workers = max_workers
-        
-    if _executor is None or _executor._shutdown:
-        _executor = ThreadPoolExecutor(max_workers=_max_workers)
     
-    return _executor
+    executor = _executor
+    if executor is None:
+        # shutdown_executor() clears the slot, so None is the only signal needed
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=_max_workers)
+                _executor_workers = _max_workers
+            executor = _executor
+    
+    return executor
 
 
 def shutdown_executor(wait: bool = True) -> None:
@@ -73,9 +94,10 @@ def shutdown_executor(wait: bool = True) -> None:
         wait: If True, wait for all pending futures to complete.
     """
     global _executor
-    if _executor is not None:
-        _executor.shutdown(wait=wait)
-        _executor = None
+    with _executor_lock:
+        executor, _executor = _executor, None
+    if executor is not None:
+        executor.shutdown(wait=wait)
 
 
 async def run_in_executor(
@@ -86,6 +108,8 @@ async def run_in_executor(
     """
     Run a synchronous function in the thread pool executor.
     
+    Must be awaited from inside a running event loop.
+    
     Args:
         func: Synchronous function to run.
         *args: Positional arguments to pass to the function.
@@ -97,7 +121,7 @@ async def run_in_executor(
     Example:
         result = await run_in_executor(sync_function, arg1, arg2, key=value)
     """
-    loop = asyncio.get_event_loop()
+    loop = asyncio.get_running_loop()
     executor = get_executor()
     
     if kwargs:
@@ -106,21 +130,88 @@ async def run_in_executor(
     return await loop.run_in_executor(executor, func, *args)
 
 
+def _needs_semaphore(max_concurrent: Optional[int]) -> bool:
+    """
+    Whether a per-call limit is tighter than the shared thread pool.
+    
+    Every network search runs on the executor, which already caps in-flight
+    searches across all callers at its worker count. Call after
+    get_executor() so the count is that of the pool actually in use.
+    """
+    return bool(max_concurrent) and max_concurrent < _executor_workers
+
+
+async def _run_all(coros: List[Any]) -> List[Any]:
+    """
+    Await coroutines concurrently and return their results in order.
+    
+    On 3.11+ a TaskGroup cancels the remaining searches as soon as one
+    fails; older versions fall back to gather. Either way the first error
+    is raised as-is, as gather does.
+    """
+    if sys.version_info < (3, 11):
+        return list(await asyncio.gather(*coros))
+    
+    try:
+        async with asyncio.TaskGroup() as group:
+            tasks = [group.create_task(coro) for coro in coros]
+    except BaseExceptionGroup as errors:  # noqa: F821 - builtin on 3.11+
+        raise errors.exceptions[0]
+    return [task.result() for task in tasks]
+
+
 # Import agent API functions (optional - requires pydantic)
 try:
     from .agent_api import search_flights as _search_flights_sync
     from .agent_api import search_airports as _search_airports_sync
-    from .agent_api import compare_flight_dates as _compare_flight_dates_sync
+    from .agent_api import _build_date_comparison
+    from .agent_api import _validate_request, _search_cache_key, _get_cached_search
+    from .agent_api import _copy_cached_search, _generate_search_url, _build_flight_data, _build_passengers
     from .schema_v2 import FlightSearchResult
     _AGENT_API_AVAILABLE = True
 except ImportError:
     _AGENT_API_AVAILABLE = False
     _search_flights_sync = None
     _search_airports_sync = None
-    _compare_flight_dates_sync = None
+    _build_date_comparison = None
+    _validate_request = None
+    _search_cache_key = None
+    _get_cached_search = None
+    _copy_cached_search = None
+    _generate_search_url = None
+    _build_flight_data = None
+    _build_passengers = None
     FlightSearchResult = None
 
 
+async def _search_flights_on(
+    executor: Optional[ThreadPoolExecutor],
+    request: Dict[str, Any],
+    fetch_mode: Optional[str],
+) -> "FlightSearchResult":
+    """Run one search, handing network work to executor (default: the shared pool)."""
+    # Bind fetch_mode once; the bare function needs no wrapper at all
+    search = partial(_search_flights_sync, fetch_mode=fetch_mode) if fetch_mode else _search_flights_sync
+    
+    # Invalid requests and cache hits never touch the network, so answer
+    # them on the event loop instead of paying for a thread handoff.
+    try:
+        request = _validate_request(request)
+    except Exception:
+        return search(request)
+    cached = _get_cached_search(_search_cache_key(request, fetch_mode or "fallback"))
+    if cached is not None:
+        # Served here rather than through search(), which would fetch if the
+        # entry expired in between; mirrors search_flights' own cache hit
+        search_url = cached.search_url or _generate_search_url(
+            _build_flight_data(request), request, _build_passengers(request)
+        )
+        return _copy_cached_search(cached, search_url)
+    
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(executor or get_executor(), search, request)
+
+
 async def search_flights_async(
     request: Dict[str, Any],
     fetch_mode: Optional[str] = None,
@@ -165,11 +256,34 @@ async def search_flights_async(
             "Async API requires pydantic. Install with: pip install fast-flights[agent]"
         )
     
-    kwargs = {}
-    if fetch_mode:
-        kwargs["fetch_mode"] = fetch_mode
+    return await _search_flights_on(None, request, fetch_mode)
+
+
+async def get_flights_async(**kwargs: Any) -> Any:
+    """
+    Async version of core.get_flights.
+    
+    Takes the same keyword arguments as get_flights and runs it on the shared
+    executor, so the fetch and the HTML parse both stay off the event loop.
+    A round-trip is a single Google Flights query (both legs travel in the
+    same tfs filter), so there are no per-leg requests to split; to overlap
+    several searches, gather several calls.
+    
+    Unlike the agent-friendly functions in this module, this does not need
+    pydantic.
     
-    return await run_in_executor(_search_flights_sync, request, **kwargs)
+    Returns:
+        Result or DecodedResult, exactly as get_flights returns.
+        
+    Example:
+        outbound, inbound = await asyncio.gather(
+            get_flights_async(flight_data=[jfk_lax], trip="one-way"),
+            get_flights_async(flight_data=[lax_jfk], trip="one-way"),
+        )
+    """
+    from .core import get_flights
+    
+    return await run_in_executor(get_flights, **kwargs)
 
 
 async def search_airports_async(query: str) -> List[Dict[str, str]]:
@@ -193,7 +307,8 @@ async def search_airports_async(query: str) -> List[Dict[str, str]]:
             "Async API requires pydantic. Install with: pip install fast-flights[agent]"
         )
     
-    return await run_in_executor(_search_airports_sync, query)
+    # In-memory scan well under a millisecond; cheaper than a thread hop.
+    return _search_airports_sync(query)
 
 
 async def compare_flight_dates_async(
@@ -203,11 +318,14 @@ async def compare_flight_dates_async(
     adults: int = 1,
     seat_class: str = "economy",
     fetch_mode: Optional[str] = None,
+    max_concurrent: int = 10,
 ) -> Dict[str, Any]:
     """
     Async version of compare_flight_dates.
     
-    Compare flight prices across multiple dates concurrently.
+    Compare flight prices across multiple dates concurrently. Each date is
+    searched as its own task, bounded by max_concurrent to avoid tripping
+    Google's rate limiting.
     
     Args:
         origin: Origin airport IATA code.
@@ -216,6 +334,7 @@ async def compare_flight_dates_async(
         adults: Number of adult passengers.
         seat_class: Seat class preference.
         fetch_mode: Override the default fetch mode.
+        max_concurrent: Maximum number of searches in flight at once.
         
     Returns:
         Dictionary with comparison results and best date recommendation.
@@ -233,13 +352,20 @@ async def compare_flight_dates_async(
             "Async API requires pydantic. Install with: pip install fast-flights[agent]"
         )
     
-    kwargs = {"adults": adults, "seat_class": seat_class}
-    if fetch_mode:
-        kwargs["fetch_mode"] = fetch_mode
-    
-    return await run_in_executor(
-        _compare_flight_dates_sync, origin, destination, dates, **kwargs
+    routes = [
+        {
+            "origin": origin,
+            "destination": destination,
+            "departure_date": date,
+            "adults": adults,
+            "seat_class": seat_class,
+        }
+        for date in dates
+    ]
+    search_results = await search_multiple_routes(
+        routes, fetch_mode=fetch_mode, max_concurrent=max_concurrent
     )
+    return _build_date_comparison(origin, destination, dates, search_results)
 
 
 async def search_multiple_routes(
@@ -260,7 +386,8 @@ async def search_multiple_routes(
             - departure_date (str): Departure date (YYYY-MM-DD)
             - Plus any other search parameters
         fetch_mode: Fetch mode to use for all searches.
-        max_concurrent: Maximum concurrent searches. Defaults to len(routes).
+        max_concurrent: Maximum concurrent searches. Only enforced when lower
+            than the executor's worker count, which bounds all callers.
         
     Returns:
         List of FlightSearchResult objects in the same order as input routes.
@@ -282,22 +409,25 @@ async def search_multiple_routes(
             "Async API requires pydantic. Install with: pip install fast-flights[agent]"
         )
     
-    if max_concurrent:
-        # Use semaphore to limit concurrency
+    # Resolve the pool once and share it across every route's task
+    executor = get_executor()
+    
+    if _needs_semaphore(max_concurrent):
+        # Use semaphore to limit concurrency below the executor's own cap
         semaphore = asyncio.Semaphore(max_concurrent)
         
         async def search_with_semaphore(route: Dict[str, Any]) -> FlightSearchResult:
             async with semaphore:
-                return await search_flights_async(route, fetch_mode=fetch_mode)
+                return await _search_flights_on(executor, route, fetch_mode)
         
         tasks = [search_with_semaphore(route) for route in routes]
     else:
         tasks = [
-            search_flights_async(route, fetch_mode=fetch_mode) 
+            _search_flights_on(executor, route, fetch_mode)
             for route in routes
         ]
     
-    return await asyncio.gather(*tasks)
+    return await _run_all(tasks)
 
 
 async def search_date_range(
@@ -343,7 +473,7 @@ async def search_date_range(
         )
         print(f"Cheapest: {result['cheapest_date']} at {result['cheapest_price']}")
     """
-    from datetime import datetime, timedelta
+    from datetime import date as date_cls
     
     if not _AGENT_API_AVAILABLE:
         raise ImportError(
@@ -351,14 +481,10 @@ async def search_date_range(
         )
     
     # Generate date list
-    start = datetime.strptime(start_date, "%Y-%m-%d")
-    end = datetime.strptime(end_date, "%Y-%m-%d")
+    start = date_cls.fromisoformat(start_date).toordinal()
+    end = date_cls.fromisoformat(end_date).toordinal()
     
-    dates = []
-    current = start
-    while current <= end:
-        dates.append(current.strftime("%Y-%m-%d"))
-        current += timedelta(days=1)
+    dates = [date_cls.fromordinal(day).isoformat() for day in range(start, end + 1)]
     
     # Build routes
     routes = [
@@ -372,32 +498,54 @@ async def search_date_range(
         for date in dates
     ]
     
-    # Search concurrently
-    results = await search_multiple_routes(
-        routes, 
-        fetch_mode=fetch_mode, 
-        max_concurrent=max_concurrent
-    )
-    
-    # Analyze results
-    date_results = dict(zip(dates, results))
-    successful = [(d, r) for d, r in date_results.items() if r.success and r.best_flight]
-    failed = [d for d, r in date_results.items() if not r.success]
+    executor = get_executor()
     
-    # Find cheapest
+    if _needs_semaphore(max_concurrent):
+        semaphore = asyncio.Semaphore(max_concurrent)
+    else:
+        semaphore = None
+    
+    async def search_date(date: str, route: Dict[str, Any]):
+        if semaphore is None:
+            return date, await _search_flights_on(executor, route, fetch_mode)
+        async with semaphore:
+            return date, await _search_flights_on(executor, route, fetch_mode)
+    
+    # Fold each result in as it lands rather than waiting on the slowest date
+    date_results: Dict[str, Any] = dict.fromkeys(dates)
+    successful = 0
+    failed = 0
     cheapest_date = None
     cheapest_price = None
-    prices = []
+    highest_price = None
     
-    for date, result in successful:
-        if result.best_flight and result.best_flight.get("price"):
+    for next_result in asyncio.as_completed(
+        [search_date(date, route) for date, route in zip(dates, routes)]
+    ):
+        date, result = await next_result
+        date_results[date] = result
+        
+        if not result.success:
+            failed += 1
+            continue
+        if not result.best_flight:
+            continue
+        successful += 1
+        
+        if result.best_flight.get("price"):
             # Extract numeric price
             price_str = result.best_flight["price"]
             try:
                 # Remove currency symbols and parse
-                price = float("".join(c for c in price_str if c.isdigit() or c == "."))
-                prices.append(price)
-                if cheapest_price is None or price < cheapest_price:
+                price = float(_NON_PRICE_CHARS.sub("", price_str))
+                if highest_price is None or price > highest_price:
+                    highest_price = price
+                # Results arrive out of order; ISO dates keep ties on the earliest day
+                if (
+                    cheapest_price is None
+                    or price < cheapest_price
+                    or (price == cheapest_price and date < cheapest_date)
+                ):
                     cheapest_price = price
                     cheapest_date = date
             except (ValueError, TypeError):
@@ -407,9 +555,11 @@ async def search_date_range(
         "dates": date_results,
         "cheapest_date": cheapest_date,
         "cheapest_price": f"${cheapest_price:.0f}" if cheapest_price else None,
-        "price_range": (f"${min(prices):.0f}", f"${max(prices):.0f}") if prices else None,
-        "successful_searches": len(successful),
-        "failed_searches": len(failed),
+        "price_range": (
+            (f"${cheapest_price:.0f}", f"${highest_price:.0f}") if highest_price is not None else None
+        ),
+        "successful_searches": successful,
+        "failed_searches": failed,
         "total_dates": len(dates),
     }
 
@@ -417,6 +567,7 @@ async def search_date_range(
 __all__ = [
     # Core async functions
     "search_flights_async",
+    "get_flights_async",
     "search_airports_async",
     "compare_flight_dates_async",
     # Multi-route functions
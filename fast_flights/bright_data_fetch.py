@@ -1,9 +1,39 @@
 import os
-from typing import Any
+import threading
+from typing import Any, Optional
 from .primp import Client
 
 
-def bright_data_fetch(params: dict) -> Any:
+# One client for every SERP call so route fan-outs share pooled connections
+# (and a single TLS handshake) to the Bright Data endpoint.
+_client: Optional[Client] = None
+_client_lock = threading.Lock()
+
+
+def _get_client() -> Client:
+    global _client
+    client = _client
+    if client is None:
+        # Executor threads can race on first use; build exactly one client
+        with _client_lock:
+            if _client is None:
+                _client = Client(verify=False, cookie_store=False)
+            client = _client
+    return client
+
+
+class DummyResponse:
+    status_code = 200
+
+    def __init__(self, text: str):
+        self.text = text  # Bright Data returns raw HTML
+        self.text_markdown = text
+
+
+def bright_data_fetch(params: dict, request_kwargs: Optional[dict] = None) -> Any:
+    # request_kwargs (cookies/headers for Google) are accepted for parity with
+    # the other fetchers; Bright Data manages the upstream session itself.
+
     # Read environment variables with defaults
     api_url = os.environ.get("BRIGHT_DATA_API_URL", "https://api.brightdata.com/request")
     api_key = os.environ.get("BRIGHT_DATA_API_KEY")  # Required, no default
@@ -16,8 +46,7 @@ def bright_data_fetch(params: dict) -> Any:
     url = "https://www.google.com/travel/flights?" + "&".join(f"{k}={v}" for k, v in params.items())
     
     # Make request to Bright Data (no impersonation needed - Bright Data handles it)
-    client = Client(verify=False)
-    res = client.post(
+    res = _get_client().post(
         api_url,
         headers={
             "Content-Type": "application/json",
@@ -29,9 +58,4 @@ def bright_data_fetch(params: dict) -> Any:
     assert res.status_code == 200, f"{res.status_code} Result: {res.text}"
     
     # Return DummyResponse with HTML content
-    class DummyResponse:
-        status_code = 200
-        text = res.text  # Bright Data returns raw HTML
-        text_markdown = text
-    
-    return DummyResponse
\ No newline at end of file
+    return DummyResponse(res.text)
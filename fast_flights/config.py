@@ -18,8 +18,9 @@ Usage:
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass, field
-from typing import Literal, Optional
+import sys
+from dataclasses import dataclass, replace
+from typing import Literal, Optional, get_args
 
 # Try to use pydantic-settings for advanced config
 try:
@@ -31,6 +32,11 @@ except ImportError:
 
 
 FetchMode = Literal["common", "fallback", "force-fallback", "local", "bright-data"]
+DataSource = Literal["html", "js"]
+
+# Resolved once so env parsing can check membership without touching typing
+_VALID_FETCH_MODES = frozenset(get_args(FetchMode))
+_VALID_DATA_SOURCES = frozenset(get_args(DataSource))
 
 
 if PYDANTIC_SETTINGS_AVAILABLE:
@@ -51,6 +57,8 @@ if PYDANTIC_SETTINGS_AVAILABLE:
             Or in code:
             >>> from fast_flights.config import configure
             >>> configure(max_retries=5)
+        
+        Instances are frozen; use configure() to change settings.
         """
         
         # Fetch settings
@@ -58,7 +66,7 @@ if PYDANTIC_SETTINGS_AVAILABLE:
             default="fallback",
             description="Default HTTP fetch strategy"
         )
-        data_source: Literal["html", "js"] = PydanticField(
+        data_source: DataSource = PydanticField(
             default="html",
             description="Default data source for parsing"
         )
@@ -133,26 +141,44 @@ if PYDANTIC_SETTINGS_AVAILABLE:
             description="Use embedded consent cookies if no cookies provided"
         )
         
+        # Transport
+        http2: bool = PydanticField(
+            default=False,
+            description="Force HTTP/2 for direct fetches so concurrent searches share one connection"
+        )
+        http_timeout: float = PydanticField(
+            default=30.0,
+            gt=0,
+            description="Timeout in seconds for direct fetches; lower values fail over to playwright sooner"
+        )
+        
         model_config = {
             "env_prefix": "FAST_FLIGHTS_",
             "env_file": ".env",
             "env_file_encoding": "utf-8",
             "extra": "ignore",
+            "frozen": True,
         }
 
 else:
-    # Fallback dataclass-based config when pydantic-settings not available
-    @dataclass
+    # Fallback dataclass-based config when pydantic-settings not available.
+    # Frozen so the shared instance can't drift; slotted where supported (3.10+).
+    _DATACLASS_OPTIONS = {"frozen": True}
+    if sys.version_info >= (3, 10):
+        _DATACLASS_OPTIONS["slots"] = True
+    
+    @dataclass(**_DATACLASS_OPTIONS)
     class FlightConfig:
         """
         Configuration for fast-flights (dataclass fallback).
         
         Settings can be set via environment variables prefixed with FAST_FLIGHTS_.
+        Instances are immutable; use configure() to change settings.
         """
         
         # Fetch settings
         default_fetch_mode: FetchMode = "fallback"
-        data_source: Literal["html", "js"] = "html"
+        data_source: DataSource = "html"
         
         # Retry settings
         max_retries: int = 3
@@ -176,16 +202,32 @@ else:
         # Cookie consent
         cookie_consent: bool = True
         
+        # Transport
+        http2: bool = False
+        http_timeout: float = 30.0
+        
         @classmethod
         def from_env(cls) -> "FlightConfig":
             """Create config from environment variables."""
+            # One pass over os.environ; lookups below hit this small dict
+            prefix = "FAST_FLIGHTS_"
+            env = {
+                key[len(prefix):]: value
+                for key, value in os.environ.items()
+                if key.startswith(prefix)
+            }
+            
             def get_env(key: str, default: str) -> str:
-                return os.environ.get(f"FAST_FLIGHTS_{key}", default)
+                return env.get(key, default)
             
             def get_env_bool(key: str, default: bool) -> bool:
                 val = get_env(key, str(default)).lower()
                 return val in ("true", "1", "yes")
             
+            def get_env_choice(key: str, default: str, choices: frozenset) -> str:
+                val = get_env(key, default)
+                return val if val in choices else default
+            
             def get_env_int(key: str, default: int) -> int:
                 try:
                     return int(get_env(key, str(default)))
@@ -199,8 +241,8 @@ else:
                     return default
             
             return cls(
-                default_fetch_mode=get_env("DEFAULT_FETCH_MODE", "fallback"),  # type: ignore
-                data_source=get_env("DATA_SOURCE", "html"),  # type: ignore
+                default_fetch_mode=get_env_choice("DEFAULT_FETCH_MODE", "fallback", _VALID_FETCH_MODES),  # type: ignore
+                data_source=get_env_choice("DATA_SOURCE", "html", _VALID_DATA_SOURCES),  # type: ignore
                 max_retries=get_env_int("MAX_RETRIES", 3),
                 retry_base_delay=get_env_float("RETRY_BASE_DELAY", 1.0),
                 retry_max_delay=get_env_float("RETRY_MAX_DELAY", 30.0),
@@ -209,10 +251,12 @@ else:
                 rate_limit_enabled=get_env_bool("RATE_LIMIT_ENABLED", True),
                 rate_limit_requests=get_env_int("RATE_LIMIT_REQUESTS", 30),
                 rate_limit_window_seconds=get_env_int("RATE_LIMIT_WINDOW_SECONDS", 60),
-                bright_data_api_key=os.environ.get("FAST_FLIGHTS_BRIGHT_DATA_API_KEY"),
+                bright_data_api_key=env.get("BRIGHT_DATA_API_KEY"),
                 bright_data_api_url=get_env("BRIGHT_DATA_API_URL", "https://api.brightdata.com/request"),
                 log_level=get_env("LOG_LEVEL", "INFO"),
                 cookie_consent=get_env_bool("COOKIE_CONSENT", True),
+                http2=get_env_bool("HTTP2", False),
+                http_timeout=get_env_float("HTTP_TIMEOUT", 30.0),
             )
 
 
@@ -269,16 +313,18 @@ def configure(**kwargs) -> FlightConfig:
     current = get_config()
     
     if PYDANTIC_SETTINGS_AVAILABLE:
-        # Merge current values with new values
-        current_dict = current.model_dump()
-        current_dict.update(kwargs)
-        _config = FlightConfig(**current_dict)
+        # Copy the current settings and validate only the overridden fields.
+        # The validator writes into the private copy directly, which frozen
+        # models allow; unknown keys are ignored, matching extra="ignore"
+        updated = current.model_copy()
+        validator = FlightConfig.__pydantic_validator__
+        for name, value in kwargs.items():
+            if name in FlightConfig.model_fields:
+                validator.validate_assignment(updated, name, value)
+        _config = updated
     else:
-        # For dataclass, create new instance
-        from dataclasses import asdict
-        current_dict = asdict(current)
-        current_dict.update(kwargs)
-        _config = FlightConfig(**current_dict)
+        # Frozen dataclass: shallow copy with the overrides applied
+        _config = replace(current, **kwargs)
     
     return _config
 
@@ -29,12 +29,22 @@ Example:
     >>> print(f"Found {len(result.flights)} flights")
 """
 
-import re
 import json
-from typing import List, Literal, Optional, Union
+import base64
+import pickle
+import threading
+from functools import lru_cache
+from itertools import islice
+from typing import Dict, List, Literal, Optional, Union
 
 from selectolax.lexbor import LexborHTMLParser, LexborNode
 
+# Optional faster JSON decoding (pip install fast-flights[speedups])
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .decoder import DecodedResult, ResultDecoder
 from .schema import Flight, Result
 from .flights_impl import FlightData, Passengers
@@ -52,7 +62,78 @@ _DEFAULT_COOKIES = {
     "CONSENT": "PENDING+987",
     "SOCS": "CAESHAgBEhJnd3NfMjAyMzA4MTAtMF9SQzIaAmRlIAEaBgiAo_CmBg",
 }
-_DEFAULT_COOKIES_BYTES = json.dumps(_DEFAULT_COOKIES).encode("utf-8")
+
+
+def _json_loads(data: Union[str, bytes]):
+    """Decode JSON with orjson when installed, else the stdlib.
+
+    Input orjson rejects but the stdlib accepts (NaN, integers wider than
+    64 bits) falls through to ``json.loads`` so results never change.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+# Shared client for direct fetches. primp pools connections per client, so
+# reusing one keeps TCP/TLS sessions alive between searches. Cookies are sent
+# per request, so the jar is disabled to keep searches independent. With
+# FlightConfig.http2 the client speaks HTTP/2 only, multiplexing concurrent
+# searches over a single connection to Google.
+_client: Optional[Client] = None
+# Options the shared client was built from, so a configure() that changes
+# them takes effect on the next fetch; None for a client from set_client()
+_client_built_from: Optional[tuple] = None
+_client_lock = threading.Lock()
+
+# Options that configure a primp Client rather than a single request
+_CLIENT_OPTIONS = frozenset({"impersonate", "verify", "proxy", "http1", "http2", "ca_cert_file"})
+
+
+def _client_options() -> dict:
+    from .config import get_config
+
+    config = get_config()
+    options = {
+        "impersonate": "chrome_126",
+        "verify": False,
+        "cookie_store": False,
+        "timeout": config.http_timeout,
+    }
+    if config.http2:
+        options["http2"] = True
+    return options
+
+
+def _get_client() -> Client:
+    global _client, _client_built_from
+    options = _client_options()
+    built_from = tuple(options.items())
+    client = _client
+    if client is None or _client_built_from not in (None, built_from):
+        # Executor threads can race on first use; build exactly one client
+        with _client_lock:
+            if _client is None or _client_built_from not in (None, built_from):
+                _client = Client(**options)
+                _client_built_from = built_from
+            client = _client
+    return client
+
+
+def set_client(client: Optional[Client] = None) -> None:
+    """
+    Replace the shared HTTP client used by fetch().
+    
+    Args:
+        client: A configured primp Client (e.g. with a proxy), kept as-is
+            until replaced, or None to go back to a default client built
+            from the current settings on next use.
+    """
+    global _client, _client_built_from
+    with _client_lock:
+        _client, _client_built_from = client, None
 
 
 def fetch(params: dict, request_kwargs: dict | None = None) -> Response:
@@ -72,9 +153,14 @@ def fetch(params: dict, request_kwargs: dict | None = None) -> Response:
     Raises:
         AssertionError: If the response status code is not 200
     """
-    client = Client(impersonate="chrome_126", verify=False)
     # Pass through any extra request kwargs (e.g., cookies, headers)
     req_kwargs = request_kwargs.copy() if request_kwargs else {}
+    overrides = {key: req_kwargs.pop(key) for key in _CLIENT_OPTIONS.intersection(req_kwargs)}
+    if overrides:
+        # Client-level settings can't change per request; use a one-shot client
+        client = Client(**{**_client_options(), **overrides})
+    else:
+        client = _get_client()
     res = client.get("https://www.google.com/travel/flights", params=params, **req_kwargs)
     assert res.status_code == 200, f"{res.status_code} Result: {res.text_markdown}"
     return res
@@ -83,10 +169,10 @@ def fetch(params: dict, request_kwargs: dict | None = None) -> Response:
 def _merge_binary_cookies(cookies_bytes: bytes | None, request_kwargs: dict | None) -> dict:
     """Parse binary cookies into request kwargs.
 
-    Supported formats (in order):
-    - JSON bytes -> dict or list of pairs
-    - Pickle bytes -> dict
-    - Raw cookie header bytes -> sets the 'Cookie' header
+    The format is picked from the first byte rather than by trial parsing:
+    - JSON bytes (``{`` or ``[``) -> dict or list of pairs
+    - Pickle bytes (protocol 2+, ``\\x80``) -> dict
+    - Anything else, or a blob that fails to parse -> sets the raw 'Cookie' header
 
     Existing request_kwargs are copied and updated; existing 'cookies' or 'headers' are overridden by parsed values.
     """
@@ -94,33 +180,25 @@ def _merge_binary_cookies(cookies_bytes: bytes | None, request_kwargs: dict | No
     if not cookies_bytes:
         return req_kwargs
 
-    # Try JSON first
-    try:
-        s = cookies_bytes.decode("utf-8")
-        parsed = json.loads(s)
-        if isinstance(parsed, dict):
-            req_kwargs['cookies'] = parsed
-            return req_kwargs
-        if isinstance(parsed, list):
-            # list of pairs
-            try:
-                req_kwargs['cookies'] = dict(parsed)
-                return req_kwargs
-            except Exception:
-                pass
-    except Exception:
-        pass
-
-    # Try pickle
-    try:
-        import pickle
+    tag = cookies_bytes.lstrip()[:1]
+    parsed = None
+    if tag in (b"{", b"["):
+        try:
+            parsed = _json_loads(cookies_bytes)
+            if isinstance(parsed, list):
+                # list of pairs
+                parsed = dict(parsed)
+        except Exception:
+            parsed = None
+    elif tag == b"\x80":
+        try:
+            parsed = pickle.loads(cookies_bytes)
+        except Exception:
+            parsed = None
 
-        parsed = pickle.loads(cookies_bytes)
-        if isinstance(parsed, dict):
-            req_kwargs['cookies'] = parsed
-            return req_kwargs
-    except Exception:
-        pass
+    if isinstance(parsed, dict):
+        req_kwargs['cookies'] = parsed
+        return req_kwargs
 
     # Fallback: treat as raw Cookie header
     try:
@@ -137,6 +215,12 @@ def _merge_binary_cookies(cookies_bytes: bytes | None, request_kwargs: dict | No
     return req_kwargs
 
 
+@lru_cache(maxsize=512)
+def _encode_tfs(raw: bytes) -> str:
+    """Base64 ``tfs`` value for serialized filter bytes (repeat searches hit the cache)."""
+    return base64.b64encode(raw).decode("utf-8")
+
+
 def get_flights_from_filter(
     filter: TFSData,
     currency: str = "",
@@ -196,29 +280,29 @@ def get_flights_from_filter(
         >>> result = get_flights_from_filter(filter, mode="fallback")
         >>> print(result.flights[0].price)
     """
-    data = filter.as_b64()
-
     params = {
-        "tfs": data.decode("utf-8"),
+        "tfs": _encode_tfs(filter.to_string()),
         "hl": "en",
         "tfu": "EgQIABABIgA",
         "curr": currency,
     }
 
     # If the caller didn't provide cookies bytes and there is no cookies or Cookie header
-    # in request_kwargs, use the embedded default cookies bytes (only when enabled).
-    if cookies is None and cookie_consent:
-        has_cookies_in_req = False
-        if request_kwargs:
-            if 'cookies' in request_kwargs:
-                has_cookies_in_req = True
-            elif 'headers' in request_kwargs and isinstance(request_kwargs['headers'], dict) and 'Cookie' in request_kwargs['headers']:
-                has_cookies_in_req = True
-        if not has_cookies_in_req:
-            cookies = _DEFAULT_COOKIES_BYTES
-
-    # Merge binary cookies into request kwargs (binary cookies take precedence)
-    req_kwargs = _merge_binary_cookies(cookies, request_kwargs)
+    # in request_kwargs, use the embedded default cookies (only when enabled).
+    use_default_cookies = cookies is None and cookie_consent
+    if use_default_cookies and request_kwargs:
+        if 'cookies' in request_kwargs:
+            use_default_cookies = False
+        elif 'headers' in request_kwargs and isinstance(request_kwargs['headers'], dict) and 'Cookie' in request_kwargs['headers']:
+            use_default_cookies = False
+
+    if use_default_cookies:
+        # The defaults are already a dict; no need to round-trip them through bytes
+        req_kwargs = request_kwargs.copy() if request_kwargs else {}
+        req_kwargs['cookies'] = _DEFAULT_COOKIES
+    else:
+        # Merge binary cookies into request kwargs (binary cookies take precedence)
+        req_kwargs = _merge_binary_cookies(cookies, request_kwargs)
 
     if mode in {"common", "fallback"}:
         try:
@@ -363,6 +447,123 @@ def get_flights(
     )
 
 
+# Result page selectors: the best/other flight lists, their items, the
+# page-level price indicator and the embedded JS payload
+_FLIGHT_LISTS_SELECTOR = 'div[jsname="IWWDBc"], div[jsname="YdtKid"]'
+_FLIGHT_ITEM_SELECTOR = "ul.Rk10dc li"
+_NESTED_ITEM_SELECTOR = "ul.Rk10dc li li"
+_CURRENT_PRICE_SELECTOR = "span.gOatQ"
+_JS_DATA_SELECTOR = r"script.ds\:1"
+
+# Response encodings whose raw bytes can go straight to the parser
+_UTF8_NAMES = frozenset({"utf-8", "utf8"})
+
+# Per-flight fields read from each <li> of a flight list
+_ITEM_SELECTORS = (
+    ("name", "div.sSHqwe.tPgKwe.ogfYpf span"),
+    ("times", "span.mv1WYe div"),
+    ("time_ahead", "span.bOzv6"),
+    ("duration", "li div.Ak5kof div"),
+    ("stops", ".BbR8Ec .ogfYpf"),
+    ("delay", ".GsCCve"),
+    ("price", ".YMlIz.FpEdX"),
+)
+
+
+def _match_item_fields(
+    container: LexborNode, items: List[LexborNode]
+) -> Dict[str, List[List[LexborNode]]]:
+    """Bucket each field's matches under the flight items that contain them.
+
+    Every selector runs once over the whole flight list instead of once per
+    item. Matches keep document order, so a bucket's first node is what
+    ``item.css_first(selector)`` would return.
+    """
+    index = {item.mem_id: j for j, item in enumerate(items)}
+    stop = container.mem_id
+    # Items nested in items must credit every ancestor; otherwise the
+    # nearest one is the only owner and the walk can end there.
+    nested = container.css_first(_NESTED_ITEM_SELECTOR) is not None
+    fields = {}
+    for key, selector in _ITEM_SELECTORS:
+        per_item: List[List[LexborNode]] = [[] for _ in items]
+        for node in container.css(selector):
+            parent = node.parent
+            while parent is not None:
+                parent_id = parent.mem_id
+                if parent_id == stop:
+                    break
+                j = index.get(parent_id)
+                if j is not None:
+                    per_item[j].append(node)
+                    if not nested:
+                        break
+                parent = parent.parent
+        fields[key] = per_item
+    return fields
+
+
+def _extract_js_data(script: str) -> Optional[str]:
+    """Return the ``data:[...]`` array literal from the ds:1 callback script.
+
+    Linear-time equivalent of ``re.search(r'^.*?\{.*?data:(\[.*\]).*}', script)``:
+    on the first line, the first ``data:[`` after the first ``{``, through the
+    last ``]`` that still has a ``}`` after it. Avoids the regex's greedy
+    backtracking over the (large) payload.
+    """
+    line = script.split("\n", 1)[0]
+    start = line.find("{")
+    last_brace = line.rfind("}")
+    if start == -1 or last_brace == -1:
+        return None
+
+    pos = line.find("data:", start + 1)
+    while pos != -1:
+        open_at = pos + 5
+        if line.startswith("[", open_at):
+            end = line.rfind("]", open_at + 1, last_brace)
+            return line[open_at:end + 1] if end != -1 else None
+        pos = line.find("data:", pos + 1)
+    return None
+
+
+class _Blank:
+    """Stand-in for a missing node; reads as empty text."""
+
+    def text(self, *_, **__):
+        return ""
+
+    def iter(self):
+        return []
+
+
+_BLANK = _Blank()
+
+
+def _safe(n: Optional[LexborNode]):
+    return n or _BLANK
+
+
+def _first(nodes: List[LexborNode]):
+    return nodes[0] if nodes else _BLANK
+
+
+# Stop labels Google actually renders; anything else goes through _parse_stops
+_STOPS_MAP: Dict[str, Union[int, str]] = {
+    "Nonstop": 0,
+    "1 stop": 1,
+    "2 stops": 2,
+    "3 stops": 3,
+    "": "Unknown",
+}
+
+
+def _parse_stops(stops: str) -> Union[int, str]:
+    try:
+        return 0 if stops == "Nonstop" else int(stops.split(" ", 1)[0])
+    except ValueError:
+        return "Unknown"
+
 
 def parse_response(
      r: Response,
@@ -404,43 +605,49 @@ def parse_response(
         their page structure. JavaScript parsing is more stable but provides
         fewer fields.
     """
-    class _blank:
-        def text(self, *_, **__):
-            return ""
-
-        def iter(self):
-            return []
-
-    blank = _blank()
-
-    def safe(n: Optional[LexborNode]):
-        return n or blank
-
-    parser = LexborHTMLParser(r.text)
+    # Reuse the DOM when the same response is parsed again (e.g. js, then html)
+    parser = getattr(r, "_ff_parser", None)
+    if parser is None:
+        # Lexbor parses UTF-8 bytes natively; handing it primp's raw body skips
+        # decoding the whole page into a Python str first
+        body = getattr(r, "content", None)
+        if not isinstance(body, bytes) or (getattr(r, "encoding", None) or "utf-8").lower() not in _UTF8_NAMES:
+            body = r.text
+        parser = LexborHTMLParser(body)
+        try:
+            r._ff_parser = parser  # type: ignore[attr-defined]
+        except AttributeError:
+            pass  # native primp responses don't accept new attributes
 
     if data_source == 'js':
-        script = parser.css_first(r'script.ds\:1').text()
+        script = parser.css_first(_JS_DATA_SELECTOR).text()
 
-        match = re.search(r'^.*?\{.*?data:(\[.*\]).*}', script)
-        assert match, 'Malformed js data, cannot find script data'
-        data = json.loads(match.group(1))
+        payload = _extract_js_data(script)
+        assert payload is not None, 'Malformed js data, cannot find script data'
+        data = _json_loads(payload)
         return ResultDecoder.decode(data) if data is not None else None
 
+    flight_lists = parser.css(_FLIGHT_LISTS_SELECTOR)
+    if not flight_lists:
+        # Consent, captcha and error pages have no result lists; fail before
+        # any further DOM work so the fallback fetch starts sooner
+        raise RuntimeError("No flights found:\n{}".format(r.text_markdown))
+
     flights = []
 
-    for i, fl in enumerate(parser.css('div[jsname="IWWDBc"], div[jsname="YdtKid"]')):
+    for i, fl in enumerate(flight_lists):
         is_best_flight = i == 0
 
-        for item in fl.css("ul.Rk10dc li")[
-            : (None if dangerously_allow_looping_last_item or i == 0 else -1)
-        ]:
+        items = fl.css(_FLIGHT_ITEM_SELECTOR)
+        count = len(items) if dangerously_allow_looping_last_item or i == 0 else len(items) - 1
+        # One row of per-field match buckets per item, in _ITEM_SELECTORS order
+        rows = islice(zip(*_match_item_fields(fl, items).values()), max(count, 0))
+
+        for name_nodes, dp_ar_node, ahead_nodes, duration_nodes, stops_nodes, delay_nodes, price_nodes in rows:
             # Flight name
-            name = safe(item.css_first("div.sSHqwe.tPgKwe.ogfYpf span")).text(
-                strip=True
-            )
+            name = _first(name_nodes).text(strip=True)
 
             # Get departure & arrival time
-            dp_ar_node = item.css("span.mv1WYe div")
             try:
                 departure_time = dp_ar_node[0].text(strip=True)
                 arrival_time = dp_ar_node[1].text(strip=True)
@@ -450,42 +657,46 @@ def parse_response(
                 arrival_time = ""
 
             # Get arrival time ahead
-            time_ahead = safe(item.css_first("span.bOzv6")).text()
+            time_ahead = _first(ahead_nodes).text()
 
             # Get duration
-            duration = safe(item.css_first("li div.Ak5kof div")).text()
+            duration = _first(duration_nodes).text()
 
             # Get flight stops
-            stops = safe(item.css_first(".BbR8Ec .ogfYpf")).text()
+            stops = _first(stops_nodes).text()
 
             # Get delay
-            delay = safe(item.css_first(".GsCCve")).text() or None
+            delay = _first(delay_nodes).text() or None
 
-            # Get prices
-            price = safe(item.css_first(".YMlIz.FpEdX")).text() or "0"
+            # Get prices (most fares are under 1,000 and carry no separator)
+            price = _first(price_nodes).text() or "0"
+            if "," in price:
+                price = price.replace(",", "")
 
             # Stops formatting
-            try:
-                stops_fmt = 0 if stops == "Nonstop" else int(stops.split(" ", 1)[0])
-            except ValueError:
-                stops_fmt = "Unknown"
+            stops_fmt = _STOPS_MAP.get(stops)
+            if stops_fmt is None:
+                stops_fmt = _parse_stops(stops)
 
+            # Positional in Flight field order: is_best, name, departure,
+            # arrival, arrival_time_ahead, duration, stops, delay, price.
+            # split()/join folds Google's narrow no-break spaces in times.
             flights.append(
-                {
-                    "is_best": is_best_flight,
-                    "name": name,
-                    "departure": " ".join(departure_time.split()),
-                    "arrival": " ".join(arrival_time.split()),
-                    "arrival_time_ahead": time_ahead,
-                    "duration": duration,
-                    "stops": stops_fmt,
-                    "delay": delay,
-                    "price": price.replace(",", ""),
-                }
+                Flight(
+                    is_best_flight,
+                    name,
+                    " ".join(departure_time.split()),
+                    " ".join(arrival_time.split()),
+                    time_ahead,
+                    duration,
+                    stops_fmt,  # type: ignore
+                    delay,
+                    price,
+                )
             )
 
-    current_price = safe(parser.css_first("span.gOatQ")).text()
+    current_price = _safe(parser.css_first(_CURRENT_PRICE_SELECTOR)).text()
     if not flights:
         raise RuntimeError("No flights found:\n{}".format(r.text_markdown))
 
-    return Result(current_price=current_price, flights=[Flight(**fl) for fl in flights])  # type: ignore
\ No newline at end of file
+    return Result(current_price=current_price, flights=flights)  # type: ignore
\ No newline at end of file
@@ -5,8 +5,10 @@ This module provides error types with standardized codes, messages,
 and recovery suggestions that AI agents can easily parse and act upon.
 """
 
+import re
 from enum import Enum
-from typing import Optional, Any
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
 
 # Try to import Pydantic for validation
 try:
@@ -55,6 +57,71 @@ class ErrorCode(str, Enum):
     UNKNOWN_ERROR = "UNKNOWN_ERROR"
 
 
+# Keyword rules for FlightSearchError.from_exception, checked in order against
+# the lowercased exception message; the first rule with a matching keyword
+# wins. Each rule is (keywords, error fields, attach the original message).
+_ERROR_CLASSIFIERS = (
+    (("no flights found", "no results"), {
+        "code": ErrorCode.NO_FLIGHTS_FOUND,
+        "message": "No flights found for the specified route and dates",
+        "recoverable": True,
+        "suggested_action": "Try different dates, nearby airports, or fewer stops restriction",
+    }, False),
+    (("429", "rate", "too many"), {
+        "code": ErrorCode.RATE_LIMITED,
+        "message": "Rate limited by Google Flights",
+        "recoverable": True,
+        "suggested_action": "Wait 30-60 seconds before retrying",
+        "retry_after_seconds": 60,
+    }, False),
+    (("403", "blocked", "forbidden"), {
+        "code": ErrorCode.BLOCKED,
+        "message": "Request blocked by Google Flights",
+        "recoverable": True,
+        "suggested_action": "Use 'fallback' or 'bright-data' fetch mode",
+    }, False),
+    (("connection", "network", "dns", "socket"), {
+        "code": ErrorCode.NETWORK_ERROR,
+        "message": "Network connection error",
+        "recoverable": True,
+        "suggested_action": "Check internet connection and retry",
+    }, False),
+    (("timeout", "timed out"), {
+        "code": ErrorCode.TIMEOUT,
+        "message": "Request timed out",
+        "recoverable": True,
+        "suggested_action": "Retry the request or use 'fallback' mode",
+    }, False),
+    (("airport", "iata"), {
+        "code": ErrorCode.INVALID_AIRPORT,
+        "message": "Invalid airport code provided",
+        "recoverable": True,
+        "suggested_action": "Verify airport codes using search_airports() function",
+    }, True),
+    (("date",), {
+        "code": ErrorCode.INVALID_DATE,
+        "message": "Invalid date format or value",
+        "recoverable": True,
+        "suggested_action": "Use YYYY-MM-DD format with a future date",
+    }, False),
+    (("passenger", "infant", "adult"), {
+        "code": ErrorCode.INVALID_PASSENGERS,
+        "message": "Invalid passenger configuration",
+        "recoverable": True,
+        "suggested_action": "Ensure total passengers ≤9 and lap infants ≤ adults",
+    }, False),
+    (("parse", "malformed", "json"), {
+        "code": ErrorCode.PARSE_ERROR,
+        "message": "Failed to parse flight data from response",
+        "recoverable": True,
+        "suggested_action": "Try 'fallback' mode or different data_source",
+    }, False),
+)
+
+# First three-digit number in an HTTP status error message
+_STATUS_CODE_RE = re.compile(r'(\d{3})')
+
+
 if PYDANTIC_AVAILABLE:
     class FlightSearchError(BaseModel):
         """
@@ -103,93 +170,15 @@ if PYDANTIC_AVAILABLE:
             """
             error_str = str(e).lower()
             
-            # No flights found
-            if "no flights found" in error_str or "no results" in error_str:
-                return cls(
-                    code=ErrorCode.NO_FLIGHTS_FOUND,
-                    message="No flights found for the specified route and dates",
-                    recoverable=True,
-                    suggested_action="Try different dates, nearby airports, or fewer stops restriction"
-                )
-            
-            # Rate limiting
-            if "429" in error_str or "rate" in error_str or "too many" in error_str:
-                return cls(
-                    code=ErrorCode.RATE_LIMITED,
-                    message="Rate limited by Google Flights",
-                    recoverable=True,
-                    suggested_action="Wait 30-60 seconds before retrying",
-                    retry_after_seconds=60
-                )
-            
-            # Blocked/forbidden
-            if "403" in error_str or "blocked" in error_str or "forbidden" in error_str:
-                return cls(
-                    code=ErrorCode.BLOCKED,
-                    message="Request blocked by Google Flights",
-                    recoverable=True,
-                    suggested_action="Use 'fallback' or 'bright-data' fetch mode"
-                )
-            
-            # Network errors
-            if any(x in error_str for x in ["connection", "network", "dns", "socket"]):
-                return cls(
-                    code=ErrorCode.NETWORK_ERROR,
-                    message="Network connection error",
-                    recoverable=True,
-                    suggested_action="Check internet connection and retry"
-                )
-            
-            # Timeout
-            if "timeout" in error_str or "timed out" in error_str:
-                return cls(
-                    code=ErrorCode.TIMEOUT,
-                    message="Request timed out",
-                    recoverable=True,
-                    suggested_action="Retry the request or use 'fallback' mode"
-                )
-            
-            # Invalid airport
-            if "airport" in error_str or "iata" in error_str:
-                return cls(
-                    code=ErrorCode.INVALID_AIRPORT,
-                    message="Invalid airport code provided",
-                    recoverable=True,
-                    suggested_action="Verify airport codes using search_airports() function",
-                    details={"original_error": str(e)}
-                )
-            
-            # Invalid date
-            if "date" in error_str:
-                return cls(
-                    code=ErrorCode.INVALID_DATE,
-                    message="Invalid date format or value",
-                    recoverable=True,
-                    suggested_action="Use YYYY-MM-DD format with a future date"
-                )
-            
-            # Passenger errors
-            if "passenger" in error_str or "infant" in error_str or "adult" in error_str:
-                return cls(
-                    code=ErrorCode.INVALID_PASSENGERS,
-                    message="Invalid passenger configuration",
-                    recoverable=True,
-                    suggested_action="Ensure total passengers ≤9 and lap infants ≤ adults"
-                )
-            
-            # Parse errors
-            if "parse" in error_str or "malformed" in error_str or "json" in error_str:
-                return cls(
-                    code=ErrorCode.PARSE_ERROR,
-                    message="Failed to parse flight data from response",
-                    recoverable=True,
-                    suggested_action="Try 'fallback' mode or different data_source"
-                )
+            for keywords, fields, with_original in _ERROR_CLASSIFIERS:
+                if any(keyword in error_str for keyword in keywords):
+                    if with_original:
+                        return cls(**fields, details={"original_error": str(e)})
+                    return cls(**fields)
             
             # HTTP status code errors
             if "status" in error_str:
-                import re
-                status_match = re.search(r'(\d{3})', str(e))
+                status_match = _STATUS_CODE_RE.search(str(e))
                 status_code = status_match.group(1) if status_match else "unknown"
                 return cls(
                     code=ErrorCode.NETWORK_ERROR,
@@ -263,6 +252,20 @@ else:
             }
 
 
+# Messages used by FlightAPIException.from_code when none is given
+_DEFAULT_MESSAGES: Mapping[ErrorCode, str] = MappingProxyType({
+    ErrorCode.INVALID_AIRPORT: "Invalid airport code provided",
+    ErrorCode.INVALID_DATE: "Invalid date format or value",
+    ErrorCode.INVALID_PASSENGERS: "Invalid passenger configuration",
+    ErrorCode.NO_FLIGHTS_FOUND: "No flights found",
+    ErrorCode.RATE_LIMITED: "Rate limited - please wait before retrying",
+    ErrorCode.BLOCKED: "Request blocked by server",
+    ErrorCode.NETWORK_ERROR: "Network connection error",
+    ErrorCode.PARSE_ERROR: "Failed to parse response",
+    ErrorCode.UNKNOWN_ERROR: "An unknown error occurred",
+})
+
+
 class FlightAPIException(Exception):
     """
     Exception with structured error information.
@@ -307,21 +310,9 @@ class FlightAPIException(Exception):
         Returns:
             FlightAPIException with structured error
         """
-        default_messages = {
-            ErrorCode.INVALID_AIRPORT: "Invalid airport code provided",
-            ErrorCode.INVALID_DATE: "Invalid date format or value",
-            ErrorCode.INVALID_PASSENGERS: "Invalid passenger configuration",
-            ErrorCode.NO_FLIGHTS_FOUND: "No flights found",
-            ErrorCode.RATE_LIMITED: "Rate limited - please wait before retrying",
-            ErrorCode.BLOCKED: "Request blocked by server",
-            ErrorCode.NETWORK_ERROR: "Network connection error",
-            ErrorCode.PARSE_ERROR: "Failed to parse response",
-            ErrorCode.UNKNOWN_ERROR: "An unknown error occurred",
-        }
-        
         error = FlightSearchError(
             code=code,
-            message=message or default_messages.get(code, str(code)),
+            message=message or _DEFAULT_MESSAGES.get(code, str(code)),
             **kwargs
         )
         return cls(error)
@@ -7,9 +7,11 @@ calendar heatmaps, and smart date suggestions.
 
 import calendar
 import re
+import sys
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
+from datetime import date as date_cls, datetime
+from functools import lru_cache
 from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Union
 
 try:
@@ -19,6 +21,8 @@ except ImportError:
     PYDANTIC_AVAILABLE = False
     BaseModel = object  # type: ignore
 
+from .utils import _CURRENCY_PREFIX
+
 # Import agent API for searches
 try:
     from .agent_api import search_flights
@@ -32,7 +36,12 @@ except ImportError:
 # Data Models
 # ============================================================================
 
-@dataclass
+# Flexible searches build one DatePrice per date searched; slot the models
+# where dataclasses support it (3.10+) to drop the per-instance __dict__.
+_DATACLASS_OPTIONS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class DatePrice:
     """Price information for a specific date."""
     date: str  # YYYY-MM-DD
@@ -55,7 +64,7 @@ class DatePrice:
         }
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class FlexibleSearchResult:
     """Result of a flexible date search."""
     origin: str
@@ -82,7 +91,7 @@ class FlexibleSearchResult:
         }
 
 
-@dataclass
+@dataclass(**_DATACLASS_OPTIONS)
 class CalendarHeatmap:
     """Monthly calendar with price data."""
     origin: str
@@ -126,12 +135,16 @@ def format_date(dt: datetime) -> str:
     return dt.strftime("%Y-%m-%d")
 
 
+# English day names indexed by datetime.weekday(); strftime("%A") would
+# follow the process locale
+_DAY_NAMES = ("Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday")
+
+
+@lru_cache(maxsize=512)
 def get_day_info(date_str: str) -> Tuple[str, bool]:
     """Get day of week name and whether it's a weekend."""
-    dt = parse_date(date_str)
-    day_name = dt.strftime("%A")
-    is_weekend = dt.weekday() >= 5  # Saturday = 5, Sunday = 6
-    return day_name, is_weekend
+    weekday = parse_date(date_str).weekday()
+    return _DAY_NAMES[weekday], weekday >= 5  # Saturday = 5, Sunday = 6
 
 
 def generate_date_range(
@@ -140,16 +153,10 @@ def generate_date_range(
     days_after: int = 0,
 ) -> List[str]:
     """Generate a list of dates around a base date."""
-    base = parse_date(base_date)
-    dates = []
-    
-    for offset in range(-days_before, days_after + 1):
-        dt = base + timedelta(days=offset)
-        # Skip dates in the past
-        if dt >= datetime.now().replace(hour=0, minute=0, second=0, microsecond=0):
-            dates.append(format_date(dt))
-    
-    return dates
+    base = parse_date(base_date).toordinal()
+    # Skip dates in the past by starting the range no earlier than today
+    start = max(base - days_before, date_cls.today().toordinal())
+    return [date_cls.fromordinal(day).isoformat() for day in range(start, base + days_after + 1)]
 
 
 def generate_weekend_dates(
@@ -157,21 +164,22 @@ def generate_weekend_dates(
     num_weekends: int = 4,
 ) -> List[str]:
     """Generate weekend dates (Saturdays and Sundays) from a start date."""
-    start = parse_date(start_date)
-    dates = []
-    current = start
-    weekends_found = 0
+    # Skip dates in the past by starting no earlier than today
+    start = max(parse_date(start_date).toordinal(), date_cls.today().toordinal())
+    weekday = date_cls.fromordinal(start).weekday()
+    saturday = start + (5 - weekday) % 7
     
-    # Find up to num_weekends worth of weekend days
-    while weekends_found < num_weekends * 2 and len(dates) < 30:
-        if current.weekday() >= 5:  # Weekend
-            if current >= datetime.now().replace(hour=0, minute=0, second=0, microsecond=0):
-                dates.append(format_date(current))
-                if current.weekday() == 6:  # Sunday
-                    weekends_found += 1
-        current += timedelta(days=1)
+    # Saturday/Sunday pairs until num_weekends * 2 Sundays are listed; a
+    # start on Sunday counts as the first of them
+    sundays = num_weekends * 2
+    days = []
+    if weekday == 6 and sundays > 0:
+        days.append(start)
+        sundays -= 1
+    for week in range(max(sundays, 0)):
+        days += (saturday + 7 * week, saturday + 7 * week + 1)
     
-    return dates
+    return [date_cls.fromordinal(day).isoformat() for day in days[:30]]
 
 
 def generate_weekday_dates(
@@ -180,40 +188,33 @@ def generate_weekday_dates(
     num_weeks: int = 4,
 ) -> List[str]:
     """Generate dates for specific weekdays."""
-    start = parse_date(start_date)
-    dates = []
-    current = start
+    offsets = sorted({day for day in weekdays if 0 <= day <= 6})
+    if not offsets or num_weeks <= 0:
+        return []
+    
+    # Skip dates in the past by starting no earlier than today
+    start = max(parse_date(start_date).toordinal(), date_cls.today().toordinal())
+    monday = start - date_cls.fromordinal(start).weekday()
+    days: List[int] = []
     weeks_covered = 0
-    last_week = -1
     
-    while weeks_covered < num_weeks and len(dates) < 30:
-        if current.weekday() in weekdays:
-            if current >= datetime.now().replace(hour=0, minute=0, second=0, microsecond=0):
-                dates.append(format_date(current))
-                
-                # Track weeks
-                current_week = current.isocalendar()[1]
-                if current_week != last_week:
-                    weeks_covered += 1
-                    last_week = current_week
-        
-        current += timedelta(days=1)
+    # Walk whole weeks; the last covered week contributes only its first date
+    while weeks_covered < num_weeks and len(days) < 30:
+        week_days = [monday + offset for offset in offsets if monday + offset >= start]
+        if week_days:
+            weeks_covered += 1
+            days += week_days[:1] if weeks_covered == num_weeks else week_days
+        monday += 7
     
-    return dates
+    return [date_cls.fromordinal(day).isoformat() for day in days[:30]]
 
 
 def generate_month_dates(year: int, month: int) -> List[str]:
     """Generate all dates in a month."""
     _, num_days = calendar.monthrange(year, month)
-    dates = []
-    today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-    
-    for day in range(1, num_days + 1):
-        dt = datetime(year, month, day)
-        if dt >= today:
-            dates.append(format_date(dt))
-    
-    return dates
+    first = date_cls(year, month, 1).toordinal()
+    start = max(first, date_cls.today().toordinal())
+    return [date_cls.fromordinal(day).isoformat() for day in range(start, first + num_days)]
 
 
 # ============================================================================
@@ -229,12 +230,14 @@ def _fetch_price_for_date(
     adults: int = 1,
 ) -> DatePrice:
     """Fetch price for a single date."""
+    day_name, is_weekend = get_day_info(date)
+    
     if not AGENT_API_AVAILABLE:
         return DatePrice(
             date=date,
             error="Agent API not available",
-            day_of_week=get_day_info(date)[0],
-            is_weekend=get_day_info(date)[1],
+            day_of_week=day_name,
+            is_weekend=is_weekend,
         )
     
     try:
@@ -247,8 +250,6 @@ def _fetch_price_for_date(
             "adults": adults,
         })
         
-        day_name, is_weekend = get_day_info(date)
-        
         if result.success and result.flights:
             best = result.flights[0]
             price = _parse_price(best.price)
@@ -268,7 +269,6 @@ def _fetch_price_for_date(
                 day_of_week=day_name,
             )
     except Exception as e:
-        day_name, is_weekend = get_day_info(date)
         return DatePrice(
             date=date,
             error=str(e),
@@ -277,9 +277,19 @@ def _fetch_price_for_date(
         )
 
 
+_PRICE_PATTERN = re.compile(r"[\d,]+\.?\d*")
+
+
 def _parse_price(price_str: str) -> float:
     """Parse price string to float."""
-    match = re.search(r"[\d,]+\.?\d*", price_str.replace(",", ""))
+    # Fast path for "$1234" / "€250.50": taken only when what follows the
+    # currency symbol is a plain decimal number, i.e. exactly what the regex
+    # below would match (unlike utils.extract_price, spaces are not dropped)
+    stripped = price_str.replace(",", "").lstrip(_CURRENCY_PREFIX)
+    if stripped[:1].isdecimal() and stripped.replace(".", "", 1).isdecimal():
+        return float(stripped)
+    
+    match = _PRICE_PATTERN.search(price_str.replace(",", ""))
     return float(match.group()) if match else 0.0
 
 
@@ -294,29 +304,44 @@ def fetch_prices_parallel(
     on_progress: Optional[Callable[[int, int], None]] = None,
 ) -> List[DatePrice]:
     """Fetch prices for multiple dates in parallel."""
-    results: List[DatePrice] = []
-    
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_to_date = {
-            executor.submit(
-                _fetch_price_for_date,
+    # Each result goes into its date's slot, so output follows input order
+    results: List[Optional[DatePrice]] = [None] * len(dates)
+    
+    # Threads rather than asyncio.run() so this also works when called from a
+    # running event loop (e.g. the MCP server). Direct fetches already share
+    # one pooled HTTP client, so every worker reuses the same connections.
+    max_workers = max(1, min(max_workers, len(dates)))
+    if max_workers == 1:
+        # Nothing to overlap; skip the pool and its thread handoffs
+        for index, date in enumerate(dates):
+            results[index] = _fetch_price_for_date(
                 origin, destination, date, return_date, seat_class, adults
-            ): date
-            for date in dates
-        }
-        
-        completed = 0
-        for future in as_completed(future_to_date):
-            result = future.result()
-            results.append(result)
-            completed += 1
-            
+            )
             if on_progress:
-                on_progress(completed, len(dates))
-    
-    # Sort by date
-    results.sort(key=lambda x: x.date)
-    return results
+                on_progress(index + 1, len(dates))
+    else:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            future_to_index = {
+                executor.submit(
+                    _fetch_price_for_date,
+                    origin, destination, date, return_date, seat_class, adults
+                ): index
+                for index, date in enumerate(dates)
+            }
+            
+            completed = 0
+            for future in as_completed(future_to_index):
+                results[future_to_index[future]] = future.result()
+                completed += 1
+                
+                if on_progress:
+                    on_progress(completed, len(dates))
+    
+    # The date generators already yield ascending dates; only caller-supplied
+    # lists out of order still need sorting
+    if any(earlier > later for earlier, later in zip(dates, dates[1:])):
+        results.sort(key=lambda x: x.date)  # type: ignore[union-attr]
+    return results  # type: ignore[return-value]
 
 
 # ============================================================================
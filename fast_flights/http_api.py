@@ -424,6 +424,9 @@ async def compare_dates_endpoint(
 # Flexible Date Endpoints
 # ============================================================================
 
+# The flexible-date results' to_dict() output is already JSON-native, so it is
+# returned as a JSONResponse to skip FastAPI's jsonable_encoder walk over it.
+
 @app.post("/flexible-search", tags=["Flexible Dates"], dependencies=[Depends(check_rate_limit)])
 async def flexible_search_endpoint(
     request: FlexibleSearchRequestModel,
@@ -451,7 +454,7 @@ async def flexible_search_endpoint(
             seat_class=request.seat_class,
             adults=request.adults,
         )
-        return result.to_dict()
+        return JSONResponse(result.to_dict())
     except Exception as e:
         logger.error(f"Flexible search error: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
@@ -484,7 +487,7 @@ async def weekend_flights_endpoint(
             seat_class=seat_class,
             adults=adults,
         )
-        return result.to_dict()
+        return JSONResponse(result.to_dict())
     except Exception as e:
         logger.error(f"Weekend search error: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
@@ -513,7 +516,7 @@ async def calendar_heatmap_endpoint(
             adults=request.adults,
             sample_days=request.sample_days,
         )
-        return result.to_dict()
+        return JSONResponse(result.to_dict())
     except Exception as e:
         logger.error(f"Calendar heatmap error: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
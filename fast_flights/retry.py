@@ -80,19 +80,30 @@ def retry_with_backoff(
         ... def custom_fetch():
         ...     pass
     """
+    # Config is only consulted for settings the caller left unset; when
+    # everything is pinned, calls skip the lookup entirely.
+    uses_config = None in (max_retries, base_delay, max_delay, exponential_base, jitter)
+    _exceptions = retryable_exceptions or DEFAULT_RETRYABLE_EXCEPTIONS
+    
     def decorator(func: F) -> F:
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            # Get config defaults
-            config = get_config()
-            
-            # Use provided values or fall back to config
-            _max_retries = max_retries if max_retries is not None else config.max_retries
-            _base_delay = base_delay if base_delay is not None else config.retry_base_delay
-            _max_delay = max_delay if max_delay is not None else config.retry_max_delay
-            _exp_base = exponential_base if exponential_base is not None else config.retry_exponential_base
-            _jitter = jitter if jitter is not None else config.retry_jitter
-            _exceptions = retryable_exceptions or DEFAULT_RETRYABLE_EXCEPTIONS
+            if uses_config:
+                # Get config defaults
+                config = get_config()
+                
+                # Use provided values or fall back to config
+                _max_retries = max_retries if max_retries is not None else config.max_retries
+                _base_delay = base_delay if base_delay is not None else config.retry_base_delay
+                _max_delay = max_delay if max_delay is not None else config.retry_max_delay
+                _exp_base = exponential_base if exponential_base is not None else config.retry_exponential_base
+                _jitter = jitter if jitter is not None else config.retry_jitter
+            else:
+                _max_retries = max_retries
+                _base_delay = base_delay
+                _max_delay = max_delay
+                _exp_base = exponential_base
+                _jitter = jitter
             
             last_exception: Optional[Exception] = None
             
@@ -16,6 +16,13 @@ class Result:
 @dataclass
 class Flight:
     """A single flight option from search results."""
+    # Parsed in bulk for every search; slots drop the per-instance __dict__.
+    # Declared by hand since dataclass(slots=True) needs Python 3.10.
+    __slots__ = (
+        "is_best", "name", "departure", "arrival", "arrival_time_ahead",
+        "duration", "stops", "delay", "price",
+    )
+
     is_best: bool
     name: str
     departure: str
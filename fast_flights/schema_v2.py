@@ -275,6 +275,32 @@ if PYDANTIC_AVAILABLE:
             }
         }
         
+        # Set once validate_passengers() has passed; cleared on any field
+        # assignment or copy so a changed request is checked again.
+        _validated: bool = False
+        
+        def __setattr__(self, name: str, value) -> None:
+            super().__setattr__(name, value)
+            if not name.startswith("_"):
+                self._validated = False
+        
+        # Copies carry private attributes along, and model_copy(update=...)
+        # writes fields without going through __setattr__ or validation.
+        def model_copy(self, *args, **kwargs) -> "FlightSearchRequest":
+            copied = super().model_copy(*args, **kwargs)
+            copied._validated = False
+            return copied
+        
+        def __copy__(self) -> "FlightSearchRequest":
+            copied = super().__copy__()
+            copied._validated = False
+            return copied
+        
+        def __deepcopy__(self, memo=None) -> "FlightSearchRequest":
+            copied = super().__deepcopy__(memo)
+            copied._validated = False
+            return copied
+        
         @property
         def trip_type(self) -> Literal["one-way", "round-trip"]:
             """Determine trip type based on whether return_date is provided."""
@@ -299,6 +325,7 @@ if PYDANTIC_AVAILABLE:
                     f"Number of lap infants ({self.infants_on_lap}) cannot exceed "
                     f"number of adults ({self.adults})"
                 )
+            self._validated = True
 
 else:
     # Fallback when Pydantic is not installed
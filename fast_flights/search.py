@@ -1,7 +1,22 @@
-from typing import List
+from typing import Iterator, List
 from ._generated_enum import Airport
 
 
+def iter_airports(query: str) -> Iterator[Airport]:
+    """Lazily search for airports.
+
+    Args:
+        query (str): The query.
+
+    Yields:
+        Airport: Matching airports (enum `Airports`), in enum order.
+    """
+    query = query.lower()
+    for aname, ref in Airport.__members__.items():
+        if query in aname.lower():
+            yield ref
+
+
 def search_airport(query: str) -> List[Airport]:
     """Search for airports.
 
@@ -11,8 +26,4 @@ def search_airport(query: str) -> List[Airport]:
     Returns:
         list[Airport]: A list of airports (enum `Airports`).
     """
-    return [
-        ref
-        for aname, ref in Airport.__members__.items()
-        if query.lower() in aname.lower()
-    ]
+    return list(iter_airports(query))
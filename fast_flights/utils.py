@@ -12,6 +12,12 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Separators the regex path below removes, and the currency symbols that lead
+# Google Flights prices
+_PRICE_SEPARATORS = str.maketrans('', '', ', ')
+_CURRENCY_PREFIX = '$€£¥'
+_PRICE_PATTERN = re.compile(r'[\d]+\.?\d*')
+
 
 def extract_price(price_str: str) -> float:
     """
@@ -37,9 +43,17 @@ def extract_price(price_str: str) -> float:
     if not price_str:
         return float('inf')
     
+    # Fast path for the common "$1,234" / "€250.50" shapes. Only taken when
+    # what follows the currency symbol is a plain decimal number (a digit
+    # first, at most one '.'), i.e. exactly what the regex would match;
+    # float() alone would also accept "1_000" or "1e5".
+    stripped = price_str.translate(_PRICE_SEPARATORS).lstrip(_CURRENCY_PREFIX)
+    if stripped[:1].isdecimal() and stripped.replace('.', '', 1).isdecimal():
+        return float(stripped)
+    
     # Remove thousands separators and find numeric value
     cleaned = price_str.replace(',', '').replace(' ', '')
-    match = re.search(r'[\d]+\.?\d*', cleaned)
+    match = _PRICE_PATTERN.search(cleaned)
     
     if match:
         try:
@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Regression test for the agent API search cache
+Runs offline: core.get_flights is replaced by a stub that counts calls
+"""
+
+from fast_flights import agent_api
+from fast_flights.agent_api import clear_search_cache, search_flights
+from fast_flights.schema import Flight, Result
+
+calls = []
+
+
+def fake_get_flights(**kwargs):
+    calls.append(kwargs)
+    return Result(
+        current_price="low",
+        flights=[
+            Flight(
+                is_best=True,
+                name="Delta",
+                departure="10:30 AM",
+                arrival="2:45 PM",
+                arrival_time_ahead="",
+                duration="5h 15m",
+                stops=0,
+                delay=None,
+                price="$299",
+            )
+        ],
+    )
+
+
+agent_api._get_flights = fake_get_flights
+clear_search_cache()
+
+request = {"origin": "JFK", "destination": "LAX", "departure_date": "2030-06-15"}
+
+# Mutating what one caller got back must not leak into later cache hits
+first = search_flights(request)
+first.flights[0].price = "$999"
+first.flights.append(first.flights[0].model_copy())
+
+second = search_flights(request)
+assert len(calls) == 1, "second search should be served from the cache"
+assert len(second.flights) == 1, second.flights
+assert second.flights[0].price == "$299", second.flights[0].price
+assert second.flights[0] is not first.flights[0]
+
+clear_search_cache()
+print("Search cache hands each caller its own flights: OK")